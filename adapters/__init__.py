@@ -5,11 +5,12 @@
 这样 Panel 只负责 UI 展示，不包含数据转换逻辑。
 """
 
-from .agent_data_adapter import AgentDataAdapter
+from .agent_data_adapter import AgentDataAdapter, AgentView
 from .task_data_adapter import TaskDataAdapter
 
 __all__ = [
     "AgentDataAdapter",
+    "AgentView",
     "TaskDataAdapter",
 ]
 
@@ -4,67 +4,174 @@ Agent 数据适配器
 将 MediatorService.fetch_agent_data() 返回的标准格式数据
 转换为 AgentInfoPanel 需要的展示格式。
 """
-from typing import List, Dict, Any
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
+
+
+# 阵营取值：己方为红军，敌方为蓝军
+_FRIENDLY = '红军'
+_ENEMY = '蓝军'
+
+
+@lru_cache(maxsize=256)
+def _unit_label(coalition_id) -> str:
+    """子群标签 "Unit-<id>"：同一 id 只格式化一次，并始终返回同一个字符串对象"""
+    return f"Unit-{coalition_id}"
+
+
+def _intern_str(value) -> str:
+    """字符串驻留后返回；后端给出的非 str 值（None、int、枚举等）只做 str() 转换"""
+    if type(value) is str:
+        return sys.intern(value)
+    return str(value)
+
+
+# 日程为空时显示的空闲条形（text 在使用时按当前任务填充）
+_IDLE_BAR = {
+    "start": 0,
+    "duration": 10,
+    "color": "silver",
+    "text": "idle",
+    "alpha": 0.8
+}
+
+
+@dataclass(slots=True, frozen=True)
+class AgentView:
+    """
+    AgentInfoPanel 一次刷新所需的全部展示数据（由 AgentDataAdapter.build_view 生成）
+    
+    各字段可以直接与上一次的视图逐项比较（==），只刷新发生变化的子组件
+    """
+    coalitions: tuple       # 子群表格行
+    friendly: tuple         # 己方智能体表格行
+    enemy: tuple            # 敌方智能体表格行
+    unit_gantt: dict        # 子群甘特图数据
+    replan_options: tuple   # 重规划甘特图选项
+    replan_data: dict       # {选项: 重规划甘特图数据}
 
 
 class AgentDataAdapter:
     """Agent 数据适配器，负责数据格式转换"""
     
+    # 中介服务状态 → 中文显示
+    _STATUS_MAP = {
+        'idle': '空闲',
+        'working': '工作中',
+        'returning': '返航',
+        'charging': '充电中',
+        'maintenance': '维护中',
+        'unknown': '未知'
+    }
+    
     @staticmethod
-    def convert_coalition_table_data(coalitions: List[Dict]) -> List[List[str]]:
+    def build_view(data: Dict[str, Any]) -> AgentView:
+        """将 fetch_agent_data() 的标准格式数据一次性转换为 AgentView"""
+        coalitions = data.get('coalitions', [])
+        friendly, enemy = AgentDataAdapter.partition_agent_table_data(data.get('agents', []))
+        unit_gantt, replan_data = AgentDataAdapter.convert_gantt_data(data)
+        return AgentView(
+            coalitions=tuple(AgentDataAdapter.convert_coalition_table_data(coalitions)),
+            friendly=tuple(friendly),
+            enemy=tuple(enemy),
+            unit_gantt=unit_gantt,
+            replan_options=tuple(AgentDataAdapter.get_replan_options(coalitions)),
+            replan_data=replan_data,
+        )
+    
+    @staticmethod
+    def convert_coalition_table_data(coalitions: List[Dict]) -> List[Tuple[str, ...]]:
         """将子群数据转换为表格格式"""
         table_data = []
         for coalition in coalitions:
-            row = [
+            row = (
                 str(coalition.get('id', 'N/A')),
                 coalition.get('current_task', '空闲'),
                 AgentDataAdapter._format_members(coalition.get('members', []))
-            ]
+            )
             table_data.append(row)
         return table_data
     
     @staticmethod
-    def convert_friendly_agent_table_data(agents: List[Dict]) -> List[List[str]]:
+    def convert_friendly_agent_table_data(agents: List[Dict]) -> List[Tuple[str, ...]]:
         """将己方智能体数据转换为表格格式"""
         table_data = []
         for agent in agents:
             # 只处理己方（红军）智能体
             faction = agent.get('faction', '')
-            if faction == '红军':
-                row = [
+            if faction == _FRIENDLY:
+                row = (
                     str(agent.get('id', 'N/A')),
                     agent.get('type', '未知'),
                     str(agent.get('coalition_id', 'N/A')) if agent.get('coalition_id') is not None else 'N/A',
                     AgentDataAdapter._format_status(agent.get('status', 'unknown'))
-                ]
+                )
                 table_data.append(row)
         return table_data
     
     @staticmethod
-    def convert_enemy_agent_table_data(agents: List[Dict]) -> List[List[str]]:
+    def convert_enemy_agent_table_data(agents: List[Dict]) -> List[Tuple[str, ...]]:
         """将敌方智能体数据转换为表格格式"""
         table_data = []
         for agent in agents:
             # 只处理敌方（蓝军）智能体
             faction = agent.get('faction', '')
-            if faction == '蓝军':
-                row = [
+            if faction == _ENEMY:
+                row = (
                     str(agent.get('id', 'N/A')),
                     agent.get('type', '未知'),
                     AgentDataAdapter._format_status(agent.get('status', 'unknown'))
-                ]
+                )
                 table_data.append(row)
         return table_data
     
+    @staticmethod
+    def partition_agent_table_data(agents: List[Dict]) -> Tuple[List[Tuple[str, ...]], List[Tuple[str, ...]]]:
+        """
+        一次遍历同时生成己方和敌方智能体表格数据
+        
+        返回：(己方表格数据, 敌方表格数据)，格式分别与
+        convert_friendly_agent_table_data / convert_enemy_agent_table_data 相同
+        """
+        # 类型/阵营/状态的取值种类很少，驻留（intern）后各行共享同一个字符串对象，
+        # 视图比较时相等性判断可以直接命中指针相等；非字符串值退回 str() 显示
+        intern = _intern_str
+        fmt = AgentDataAdapter._STATUS_MAP.get
+        friendly_rows = []
+        enemy_rows = []
+        for agent in agents:
+            g = agent.get
+            faction = g('faction', '')
+            if faction == _FRIENDLY:
+                coalition_id = g('coalition_id')
+                status = g('status', 'unknown')
+                friendly_rows.append((
+                    str(g('id', 'N/A')),
+                    intern(g('type', '未知')),
+                    str(coalition_id) if coalition_id is not None else 'N/A',
+                    intern(fmt(status, status))
+                ))
+            elif faction == _ENEMY:
+                status = g('status', 'unknown')
+                enemy_rows.append((
+                    str(g('id', 'N/A')),
+                    intern(g('type', '未知')),
+                    intern(fmt(status, status))
+                ))
+        return friendly_rows, enemy_rows
+    
     @staticmethod
     def convert_unit_gantt_data(data: Dict[str, Any]) -> Dict[str, Any]:
         """将数据转换为子群甘特图格式"""
         coalitions = data.get('coalitions', [])
+        to_bars = AgentDataAdapter._convert_schedule_to_bars
         tracks = []
         for coalition in coalitions:
             track = {
-                "label": f"Unit-{coalition.get('id', 0)}",
-                "bars": AgentDataAdapter._convert_schedule_to_bars(
+                "label": _unit_label(coalition.get('id', 0)),
+                "bars": to_bars(
                     coalition.get('schedule', []),
                     coalition.get('current_task', None)
                 )
@@ -81,47 +188,81 @@ class AgentDataAdapter:
     def convert_replan_gantt_data(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """将数据转换为重规划甘特图格式"""
         coalitions = data.get('coalitions', [])
+        to_bars = AgentDataAdapter._convert_schedule_to_bars
+        current_time = data.get('current_time', 0)
         result = {}
         for coalition in coalitions:
-            option_key = f"Unit-{coalition.get('id', 0)}"
+            option_key = _unit_label(coalition.get('id', 0))
             replan_schedule = coalition.get('replan_schedule', [])
             
             result[option_key] = {
                 "tracks": [
                     {
                         "label": option_key,
-                        "bars": AgentDataAdapter._convert_schedule_to_bars(replan_schedule)
+                        "bars": to_bars(replan_schedule)
                     }
                 ],
-                "current_time": data.get('current_time', 0),
+                "current_time": current_time,
                 "y_label_fontsize": 10
             }
         return result
     
+    @staticmethod
+    def convert_gantt_data(data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """
+        一次遍历子群，同时生成子群甘特图和重规划甘特图数据
+        
+        返回：(convert_unit_gantt_data 的结果, convert_replan_gantt_data 的结果)
+        """
+        to_bars = AgentDataAdapter._convert_schedule_to_bars
+        current_time = data.get('current_time', 0)
+        tracks = []
+        replan = {}
+        for coalition in data.get('coalitions', []):
+            g = coalition.get
+            label = _unit_label(g('id', 0))
+            tracks.append({
+                "label": label,
+                "bars": to_bars(g('schedule', []), g('current_task', None))
+            })
+            replan[label] = {
+                "tracks": [
+                    {
+                        "label": label,
+                        "bars": to_bars(g('replan_schedule', []))
+                    }
+                ],
+                "current_time": current_time,
+                "y_label_fontsize": 10
+            }
+        
+        unit = {
+            "tracks": tracks,
+            "current_time": current_time,
+            "y_label_fontsize": 10
+        }
+        return unit, replan
+    
     @staticmethod
     def get_replan_options(coalitions: List[Dict]) -> List[str]:
         """获取重规划甘特图的选项列表"""
-        return [f"Unit-{c.get('id', i)}" for i, c in enumerate(coalitions)]
+        return [_unit_label(c.get('id', i)) for i, c in enumerate(coalitions)]
     
     @staticmethod
     def _format_members(members: List) -> str:
         """格式化成员结构字符串"""
+        # 后端可能传 None，先判空再取长度
         if not members:
             return "0个成员"
-        return f"{len(members)}个成员 [{', '.join(str(m) for m in members[:3])}{'...' if len(members) > 3 else ''}]"
+        n = len(members)
+        head = ', '.join(map(str, members[:3]))
+        suffix = '...' if n > 3 else ''
+        return f"{n}个成员 [{head}{suffix}]"
     
     @staticmethod
     def _format_status(status: str) -> str:
         """将中介服务状态转换为中文显示"""
-        status_map = {
-            'idle': '空闲',
-            'working': '工作中',
-            'returning': '返航',
-            'charging': '充电中',
-            'maintenance': '维护中',
-            'unknown': '未知'
-        }
-        return status_map.get(status, status)
+        return AgentDataAdapter._STATUS_MAP.get(status, status)
     
     @staticmethod
     def _convert_schedule_to_bars(schedule: List[Dict], current_task: str = None) -> List[Dict]:
@@ -132,25 +273,22 @@ class AgentDataAdapter:
             current_task: 当前任务名称
         返回：甘特图条形数据列表
         """
-        bars = []
-        for item in schedule:
-            bars.append({
-                "start": item.get('start', 0),
-                "duration": item.get('end', 0) - item.get('start', 0),
-                "color": item.get('color', 'silver'),
-                "text": item.get('task', ''),
+        # 每个条目的 start 只取一次，同时用于起点和时长
+        bars = [
+            {
+                "start": start,
+                "duration": g('end', 0) - start,
+                "color": g('color', 'silver'),
+                "text": g('task', ''),
                 "alpha": 0.8
-            })
+            }
+            for g in (item.get for item in schedule)
+            for start in (g('start', 0),)
+        ]
         
         # 如果没有数据，至少显示一个空闲状态
         if not bars:
-            bars.append({
-                "start": 0,
-                "duration": 10,
-                "color": "silver",
-                "text": current_task or "idle",
-                "alpha": 0.8
-            })
+            bars.append(dict(_IDLE_BAR, text=current_task or "idle"))
         
         return bars
 
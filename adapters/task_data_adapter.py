@@ -4,87 +4,124 @@ Task 数据适配器
 将 MediatorService.fetch_task_data() 返回的标准格式数据
 转换为 TaskInfoPanel 需要的展示格式。
 """
-from typing import List, Dict, Any
+from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Any, Tuple
+
+
+_UNASSIGNED = "Unassigned"
+
+
+@lru_cache(maxsize=256)
+def _coalition_label(coalition_id) -> str:
+    """甘特图轨道标签：未分配子群（id < 0）统一显示为 Unassigned"""
+    return f"Coalition-{coalition_id}" if coalition_id >= 0 else _UNASSIGNED
+
+
+@lru_cache(maxsize=1024)
+def _task_label(task_id) -> str:
+    """任务条形文字 "T<id>"：任务在多次刷新之间基本不变，同一 id 只格式化一次"""
+    return f"T{task_id}"
 
 
 class TaskDataAdapter:
     """Task 数据适配器，负责数据格式转换"""
     
+    # 中介服务任务状态 → 中文显示
+    _STATUS_MAP = {
+        'pending': '待执行',
+        'executing': '执行中',
+        'completed': '已完成',
+        'failed': '失败',
+        'cancelled': '已取消',
+        'unknown': '未知'
+    }
+    
+    # 任务类型 → 甘特图颜色
+    _COLOR_MAP = {
+        'patrol': 'lightblue',
+        'surveillance': 'lightgreen',
+        'search': 'lightyellow',
+        'rescue': 'lightcoral',
+        'transport': 'lightpink',
+        'unknown': 'gray'
+    }
+    
     @staticmethod
-    def convert_table_data(tasks: List[Dict]) -> List[List[str]]:
+    def convert_table_data(tasks: List[Dict]) -> List[Tuple[str, ...]]:
         """将任务数据转换为表格数据"""
+        fmt = TaskDataAdapter._STATUS_MAP.get
         table_data = []
         for task in tasks:
-            row = [
-                str(task.get('id', 'N/A')),
-                task.get('type', '未知'),
-                task.get('area', 'N/A'),
-                str(task.get('coalition_id', 'N/A')),
-                TaskDataAdapter._format_task_status(task.get('status', 'unknown'))
-            ]
+            g = task.get
+            status = g('status', 'unknown')
+            row = (
+                str(g('id', 'N/A')),
+                g('type', '未知'),
+                g('area', 'N/A'),
+                str(g('coalition_id', 'N/A')),
+                fmt(status, status)
+            )
             table_data.append(row)
         return table_data
     
     @staticmethod
     def convert_gantt_data(data: Dict[str, Any]) -> Dict[str, Any]:
         """将任务数据转换为甘特图数据"""
-        tasks = data.get('tasks', [])
+        _, tracks = TaskDataAdapter.convert_tasks(data.get('tasks', []), with_table=False)
+        return TaskDataAdapter.build_gantt_data(tracks, data.get('current_time', 0))
+    
+    @staticmethod
+    def convert_tasks(tasks: List[Dict], with_table: bool = True) -> Tuple[List[Tuple[str, ...]], List[Dict[str, Any]]]:
+        """
+        一次遍历任务列表，同时生成表格数据和甘特图轨道
         
-        # 按子群分组任务
-        coalition_tasks = {}
+        返回：(表格数据, 甘特图轨道列表)；with_table=False 时表格数据为空列表。
+        表格数据与 convert_table_data 相同，轨道可交给 build_gantt_data 组装成甘特图数据
+        """
+        fmt = TaskDataAdapter._STATUS_MAP.get
+        color_of = TaskDataAdapter._COLOR_MAP.get
+        table_data = []
+        coalition_bars = defaultdict(list)
         for task in tasks:
-            cid = task.get('coalition_id', -1)
-            if cid not in coalition_tasks:
-                coalition_tasks[cid] = []
-            coalition_tasks[cid].append(task)
+            g = task.get
+            coalition_id = g('coalition_id', -1)
+            if with_table:
+                status = g('status', 'unknown')
+                table_data.append((
+                    str(g('id', 'N/A')),
+                    g('type', '未知'),
+                    g('area', 'N/A'),
+                    str(g('coalition_id', 'N/A')),
+                    fmt(status, status)
+                ))
+            # 直接按子群分组生成条形数据
+            coalition_bars[coalition_id].append({
+                "start": g('start_time', 0),
+                "duration": g('duration', 0),
+                "color": color_of(g('type', 'unknown'), 'silver'),
+                "text": _task_label(g('id', 'N/A')),
+                "alpha": 0.8
+            })
         
         # 生成甘特图轨道
+        by_start = itemgetter('start')
         tracks = []
-        for coalition_id, task_list in coalition_tasks.items():
-            bars = []
-            for task in task_list:
-                bars.append({
-                    "start": task.get('start_time', 0),
-                    "duration": task.get('duration', 0),
-                    "color": TaskDataAdapter._get_task_color(task.get('type', 'unknown')),
-                    "text": f"T{task.get('id', 'N/A')}",
-                    "alpha": 0.8
-                })
-            
+        for coalition_id, bars in coalition_bars.items():
+            # 原地排序，避免复制列表
+            bars.sort(key=by_start)
             tracks.append({
-                "label": f"Coalition-{coalition_id}" if coalition_id >= 0 else "Unassigned",
-                "bars": sorted(bars, key=lambda x: x['start'])
+                "label": _coalition_label(coalition_id),
+                "bars": bars
             })
-        
+        return table_data, tracks
+    
+    @staticmethod
+    def build_gantt_data(tracks: List[Dict[str, Any]], current_time: float = 0) -> Dict[str, Any]:
+        """用已生成的轨道组装甘特图数据"""
         return {
             "tracks": tracks,
-            "current_time": data.get('current_time', 0),
+            "current_time": current_time,
             "y_label_fontsize": 10
         }
-    
-    @staticmethod
-    def _format_task_status(status: str) -> str:
-        """将中介服务任务状态转换为中文显示"""
-        status_map = {
-            'pending': '待执行',
-            'executing': '执行中',
-            'completed': '已完成',
-            'failed': '失败',
-            'cancelled': '已取消',
-            'unknown': '未知'
-        }
-        return status_map.get(status, status)
-    
-    @staticmethod
-    def _get_task_color(task_type: str) -> str:
-        """根据任务类型返回颜色"""
-        color_map = {
-            'patrol': 'lightblue',
-            'surveillance': 'lightgreen',
-            'search': 'lightyellow',
-            'rescue': 'lightcoral',
-            'transport': 'lightpink',
-            'unknown': 'gray'
-        }
-        return color_map.get(task_type, 'silver')
-
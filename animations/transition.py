@@ -1,4 +1,4 @@
-from typing import Iterable, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 
 from PyQt5.QtCore import QEasingCurve, QObject, QParallelAnimationGroup, QPropertyAnimation
 from PyQt5.QtWidgets import QWidget, QGraphicsOpacityEffect
@@ -16,7 +16,13 @@ class FadeTransitionManager(QObject):
     def __init__(self, parent: Optional[QObject] = None, duration_ms: int = 420):
         super().__init__(parent)
         self._duration = duration_ms
-        self._running_group: Optional[QParallelAnimationGroup] = None
+        # 动画组和每个 widget 的属性动画都只创建一次，之后每次淡入/淡出复用，
+        # 避免每次切换模式都重新分配 QObject
+        self._group = QParallelAnimationGroup(self)
+        self._group.finished.connect(self._on_group_finished)
+        self._anims: Dict[int, QPropertyAnimation] = {}
+        self._pending_hide: List[QWidget] = []
+        self._pending_callback: Optional[Callable[[], None]] = None
 
     def _ensure_opacity_effect(self, w: QWidget) -> QGraphicsOpacityEffect:
         effect = w.graphicsEffect()
@@ -25,6 +31,26 @@ class FadeTransitionManager(QObject):
             w.setGraphicsEffect(effect)
         return effect
 
+    def _ensure_animation(self, w: QWidget, start: float, end: float) -> QPropertyAnimation:
+        """取出（或首次创建）该 widget 的不透明度动画，并设置起止值"""
+        effect = self._ensure_opacity_effect(w)
+        anim = self._anims.get(id(w))
+        # widget 被替换或效果对象被重建时，缓存的动画目标已失效，需要重新创建
+        if anim is None or anim.targetObject() is not effect:
+            anim = QPropertyAnimation(effect, b"opacity", self)
+            anim.setEasingCurve(QEasingCurve.InOutQuad)
+            self._anims[id(w)] = anim
+        anim.setDuration(self._duration)
+        anim.setStartValue(start)
+        anim.setEndValue(end)
+        return anim
+
+    def _reset_group(self) -> None:
+        """停止当前动画组并取出其中的动画（takeAnimation 不会删除动画对象）"""
+        self._group.stop()
+        while self._group.animationCount():
+            self._group.takeAnimation(0)
+
     def fade_widgets(
         self,
         to_show: Iterable[QWidget],
@@ -37,13 +63,8 @@ class FadeTransitionManager(QObject):
         - 对 to_hide：1. 确保可见 → 2. 不透明度 1 → 0 → 3. 动画结束时再 setVisible(False)
         - 对 to_show：1. 先 setVisible(True) → 2. 不透明度 0 → 1
         """
-        # 如果上一次动画还在跑，先取消掉
-        if self._running_group is not None:
-            self._running_group.stop()
-            self._running_group.deleteLater()
-            self._running_group = None
-
-        group = QParallelAnimationGroup(self)
+        # 如果上一次动画还在跑，先取消掉（被取消的那次不再执行结束回调）
+        self._reset_group()
 
         # 需要在动画结束后再真正隐藏的 widget
         widgets_to_hide_after = []
@@ -52,45 +73,34 @@ class FadeTransitionManager(QObject):
             if w is None:
                 continue
             w.setVisible(True)
-            effect = self._ensure_opacity_effect(w)
-            anim = QPropertyAnimation(effect, b"opacity", self)
-            anim.setDuration(self._duration)
-            anim.setStartValue(1.0)
-            anim.setEndValue(0.0)
-            anim.setEasingCurve(QEasingCurve.InOutQuad)
-            group.addAnimation(anim)
+            self._group.addAnimation(self._ensure_animation(w, 1.0, 0.0))
             widgets_to_hide_after.append(w)
 
         for w in to_show:
             if w is None:
                 continue
             w.setVisible(True)
-            effect = self._ensure_opacity_effect(w)
+            anim = self._ensure_animation(w, 0.0, 1.0)
             # 立即把即将显示的 widget 设为透明，再慢慢淡入
-            effect.setOpacity(0.0)
-            anim = QPropertyAnimation(effect, b"opacity", self)
-            anim.setDuration(self._duration)
-            anim.setStartValue(0.0)
-            anim.setEndValue(1.0)
-            anim.setEasingCurve(QEasingCurve.InOutQuad)
-            group.addAnimation(anim)
-
-        def _on_finished():
-            # 动画结束后，真正隐藏需要关闭的 widget，并把其透明度恢复到 1
-            for w in widgets_to_hide_after:
-                eff = w.graphicsEffect()
-                if isinstance(eff, QGraphicsOpacityEffect):
-                    eff.setOpacity(1.0)
-                w.setVisible(False)
-
-            if finished_callback is not None:
-                finished_callback()
-
-            group.deleteLater()
-            self._running_group = None
-
-        group.finished.connect(_on_finished)
-        self._running_group = group
-        group.start()
-
-
+            anim.targetObject().setOpacity(0.0)
+            self._group.addAnimation(anim)
+
+        self._pending_hide = widgets_to_hide_after
+        self._pending_callback = finished_callback
+        self._group.start()
+
+    def _on_group_finished(self) -> None:
+        # 动画结束后，真正隐藏需要关闭的 widget，并把其透明度恢复到 1
+        widgets_to_hide_after = self._pending_hide
+        finished_callback = self._pending_callback
+        self._pending_hide = []
+        self._pending_callback = None
+
+        for w in widgets_to_hide_after:
+            eff = w.graphicsEffect()
+            if isinstance(eff, QGraphicsOpacityEffect):
+                eff.setOpacity(1.0)
+            w.setVisible(False)
+
+        if finished_callback is not None:
+            finished_callback()
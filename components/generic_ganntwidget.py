@@ -1,9 +1,26 @@
 # ui/widgets/gantt_chart.py
+from functools import lru_cache
+
+from matplotlib.colors import to_rgba
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from MultiAgentGUI.themes.matplotlib_font_config import setup_chinese_font
 
 
+@lru_cache(maxsize=256)
+def _cached_rgba(color, alpha):
+    return to_rgba(color, alpha)
+
+
+def _rgba(color, alpha):
+    """颜色名 → RGBA：调色板只有少数几种颜色，解析结果按 (颜色, 透明度) 缓存"""
+    try:
+        return _cached_rgba(color, alpha)
+    except TypeError:
+        # 列表等不可哈希的颜色值不缓存
+        return to_rgba(color, alpha)
+
+
 class GenericGanttChart(FigureCanvas):
     """通用甘特图组件，接受标准化绘图指令"""
     def __init__(self):
@@ -46,14 +63,22 @@ class GenericGanttChart(FigureCanvas):
 
         for idx, track in enumerate(tracks):
             y_base = interval * idx + y_margin
-            for bar in track.get("bars", []):
-                self.ax.broken_barh(
-                    [(bar["start"], bar["duration"])],
-                    [y_base, height],
-                    facecolors=bar.get("color", "gray"),
-                    edgecolor="k",
-                    alpha=bar.get("alpha", 1.0)
-                )
+            bars = track.get("bars", [])
+            if not bars:
+                continue
+            # 每条轨道只调用一次 broken_barh：各条形的颜色和透明度合成为逐段的 RGBA，
+            # 由同一个 BrokenBarHCollection 绘制，而不是每个条形一个集合
+            xranges = [(bar["start"], bar["duration"]) for bar in bars]
+            alphas = [bar.get("alpha", 1.0) for bar in bars]
+            self.ax.broken_barh(
+                xranges,
+                [y_base, height],
+                facecolors=[_rgba(bar.get("color", "gray"), a) for bar, a in zip(bars, alphas)],
+                edgecolors=[(0.0, 0.0, 0.0, a) for a in alphas],
+                # 条形都是轴对齐的矩形，关闭抗锯齿不影响观感，能减少栅格化开销
+                antialiaseds=False,
+            )
+            for bar in bars:
                 if bar.get("text"):
                     self.ax.text(
                         x=bar["start"] + 0.5,
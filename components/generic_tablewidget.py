@@ -1,12 +1,88 @@
 from PyQt5.QtGui import QFont
-from PyQt5.QtWidgets import QTableWidgetItem, QHeaderView
-from qfluentwidgets import TableWidget
-from typing import List, Any
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QHeaderView
+from qfluentwidgets import TableView
+from typing import List, Any, Optional, Sequence
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
 from MultiAgentGUI.themes import Theme
 
 
-class GenericTableWidget(TableWidget):
+def _build_table_qss() -> str:
+    return f"""
+        QTableView {{
+            background-color: transparent;
+            border: 1px solid {Theme.BORDER};
+            border-radius: {Theme.BORDER_RADIUS}px;
+            gridline-color: {Theme.BORDER_LIGHT};
+            color: {Theme.TEXT_PRIMARY};
+            alternate-background-color: transparent;
+        }}
+        QTableView::item {{
+            border: none;
+            padding: 4px;
+            background-color: transparent;
+        }}
+        QTableView::item:alternate {{
+            background-color: transparent;
+        }}
+        QTableView::item:selected {{
+            background-color: {Theme.PRIMARY_LIGHT};
+            color: {Theme.TEXT_PRIMARY};
+        }}
+        QHeaderView::section {{
+            background-color: {Theme.PANEL_BACKGROUND};
+            color: {Theme.TEXT_PRIMARY};
+            border: none;
+            border-bottom: 2px solid {Theme.BORDER};
+            padding: 6px;
+        }}
+    """
+
+
+class _RowTableModel(QAbstractTableModel):
+    """
+    只读表格模型：直接持有二维行数据，视图按需（仅可见单元格）调用 data() 取值，
+    不为每个单元格创建 QTableWidgetItem
+    """
+
+    def __init__(self, column_labels: List[str], parent=None):
+        super().__init__(parent)
+        self._labels = list(column_labels)
+        self._rows: Sequence[Sequence[Any]] = []
+
+    def set_rows(self, rows: Sequence[Sequence[Any]]):
+        """整体替换数据，只触发一次模型重置（一次布局）"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._labels)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Optional[Any]:
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+        if column >= len(row):
+            return None
+        return str(row[column])
+
+    def headerData(self, section: int, orientation: int, role: int = Qt.DisplayRole) -> Optional[Any]:
+        if orientation != Qt.Horizontal:
+            return None
+        if role == Qt.DisplayRole:
+            return self._labels[section]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+
+class GenericTableWidget(TableView):
     def __init__(self, column_labels: List[str]):
         super().__init__()
         self.setBorderVisible(True)
@@ -17,60 +93,27 @@ class GenericTableWidget(TableWidget):
         self.setAlternatingRowColors(False)
 
         self.column_count = len(column_labels)
-        self.setColumnCount(self.column_count)
-        self.setHorizontalHeaderLabels(column_labels)
+        self._model = _RowTableModel(column_labels, self)
+        self.setModel(self._model)
         self.verticalHeader().hide()
+        # 固定行高：视图无需逐行探测内容高度，只为视口内的行取数据
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(36)
 
         # Header font：略大一点并加粗，但保持相对克制
         font = self.horizontalHeader().font()
         self.horizontalHeader().setFont(QFont(font.family(), font.pointSize() + 1, QFont.DemiBold))
 
-        # Center-align headers
-        for i in range(self.column_count):
-            self.horizontalHeaderItem(i).setTextAlignment(Qt.AlignCenter)
+        # 表头居中由模型的 headerData(TextAlignmentRole) 提供
 
         # 让所有列均匀分布宽度
         header = self.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
         
         # 应用主题样式 - 背景色透明以显示panel背景
-        self.setStyleSheet(f"""
-            QTableWidget {{
-                background-color: transparent;
-                border: 1px solid {Theme.BORDER};
-                border-radius: {Theme.BORDER_RADIUS}px;
-                gridline-color: {Theme.BORDER_LIGHT};
-                color: {Theme.TEXT_PRIMARY};
-                alternate-background-color: transparent;
-            }}
-            QTableWidget::item {{
-                border: none;
-                padding: 4px;
-                background-color: transparent;
-            }}
-            QTableWidget::item:alternate {{
-                background-color: transparent;
-            }}
-            QTableWidget::item:selected {{
-                background-color: {Theme.PRIMARY_LIGHT};
-                color: {Theme.TEXT_PRIMARY};
-            }}
-            QHeaderView::section {{
-                background-color: {Theme.PANEL_BACKGROUND};
-                color: {Theme.TEXT_PRIMARY};
-                border: none;
-                border-bottom: 2px solid {Theme.BORDER};
-                padding: 6px;
-            }}
-        """)
-
-    def set_table_data(self, data: List[List[Any]]):
-        """Accepts flat 2D list. Each inner list is a row."""
-        self.setRowCount(len(data))
-        for i, row in enumerate(data):
-            for j, item in enumerate(row):
-                table_item = QTableWidgetItem(str(item))
-                table_item.setTextAlignment(Qt.AlignCenter)
-                self.setItem(i, j, table_item)
-
-        # 数据更新后保持各列均匀宽度（Stretch 模式）
\ No newline at end of file
+        self.setStyleSheet(Theme.cached_stylesheet("generic_table", _build_table_qss))
+
+    def set_table_data(self, data: Sequence[Sequence[Any]]):
+        """Accepts flat 2D sequence. Each inner list/tuple is a row."""
+        # 直接替换模型数据，视图只为可见单元格取值；列宽保持 Stretch 均匀分布
+        self._model.set_rows(data)
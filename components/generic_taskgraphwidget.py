@@ -38,7 +38,8 @@ class GenericTaskGraphWidget(FigureCanvas):
             ...
         ],
         "layout": {                           # 布局配置（可选）
-            "algorithm": str                  # 布局算法（"spring"/"circular"/"hierarchical"，默认"spring"）
+            "algorithm": str,                 # 布局算法（"spring"/"circular"/"hierarchical"，默认"spring"）
+            "cache_key": str                  # 图结构标识（可选），提供时直接作为布局缓存键，不再计算hash
         }
     }
     """
@@ -97,8 +98,8 @@ class GenericTaskGraphWidget(FigureCanvas):
                 G.add_edge(source, target)
                 edge_types[(source, target)] = edge_type
         
-        # 计算图的hash值（基于节点和边的结构）
-        graph_hash = self._compute_graph_hash(G)
+        # 图结构标识：优先使用后端提供的 cache_key，否则基于节点和边的结构计算hash
+        graph_hash = layout_config.get("cache_key") or self._compute_graph_hash(G)
         
         # 检查是否需要重新计算布局
         algorithm = layout_config.get("algorithm", "spring")
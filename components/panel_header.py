@@ -10,12 +10,31 @@ from qfluentwidgets import BodyLabel
 from MultiAgentGUI.themes import Theme
 
 
+def _build_header_qss(header_bg: str, border_color: str, left_bar_color: str, text_color: str) -> str:
+    return f"""
+        PanelHeader {{
+            background-color: {header_bg};
+            border-bottom: 2px solid {border_color};
+            border-left: 4px solid {left_bar_color};
+            border-top-left-radius: {Theme.BORDER_RADIUS}px;
+            border-top-right-radius: {Theme.BORDER_RADIUS}px;
+        }}
+        QLabel {{
+            color: {text_color};
+            background-color: transparent;
+        }}
+    """
+
+
 class PanelHeader(QWidget):
     """
     面板标题栏组件
     显示面板的中文名称，提供统一的视觉风格
     """
     
+    # 所有标题栏共用的标题字体，首次使用时创建（需在 QApplication 之后）
+    _TITLE_FONT = None
+    
     def __init__(
         self,
         title: str,
@@ -45,6 +64,53 @@ class PanelHeader(QWidget):
         self._text_color = text_color
         self._init_ui()
     
+    @classmethod
+    def _title_font(cls) -> QFont:
+        if cls._TITLE_FONT is None:
+            font = QFont()
+            font.setFamily("Microsoft YaHei")
+            # 放大字号 + 加粗，让标题更醒目
+            font.setPointSize(15)          # 比普通内容明显更大
+            font.setWeight(QFont.Bold)     # 使用更粗的字重
+            cls._TITLE_FONT = font
+        return cls._TITLE_FONT
+    
+    @classmethod
+    def _for_family(cls, title: str, bg_color: str, accent_color: str, parent=None) -> "PanelHeader":
+        """按面板配色族创建标题栏：下边框、左侧竖条和标题文字统一使用该族的深色"""
+        return cls(
+            title,
+            parent,
+            bg_color=bg_color,
+            border_color=accent_color,
+            left_bar_color=accent_color,
+            text_color=accent_color,
+        )
+    
+    @classmethod
+    def for_simulation(cls, title: str, parent=None) -> "PanelHeader":
+        """仿真类面板（仿真视图 / 场景设计 / 占位面板）的标题栏"""
+        return cls._for_family(title, Theme.PANEL_SIMULATION_HEADER_BG,
+                               Theme.PANEL_SIMULATION_HEADER_BORDER, parent)
+    
+    @classmethod
+    def for_task(cls, title: str, parent=None) -> "PanelHeader":
+        """任务面板的标题栏"""
+        return cls._for_family(title, Theme.PANEL_TASK_HEADER_BG,
+                               Theme.PANEL_TASK_HEADER_BORDER, parent)
+    
+    @classmethod
+    def for_agent(cls, title: str, parent=None) -> "PanelHeader":
+        """智能体面板的标题栏"""
+        return cls._for_family(title, Theme.PANEL_AGENT_HEADER_BG,
+                               Theme.PANEL_AGENT_HEADER_BORDER, parent)
+    
+    @classmethod
+    def for_command(cls, title: str, parent=None) -> "PanelHeader":
+        """命令面板的标题栏"""
+        return cls._for_family(title, Theme.PANEL_COMMAND_HEADER_BG,
+                               Theme.PANEL_COMMAND_HEADER_BORDER, parent)
+    
     def _init_ui(self):
         """初始化UI"""
         layout = QHBoxLayout(self)
@@ -54,12 +120,7 @@ class PanelHeader(QWidget):
         
         # 创建标题标签
         self.title_label = QLabel(self._title)
-        font = QFont()
-        font.setFamily("Microsoft YaHei")
-        # 放大字号 + 加粗，让标题更醒目
-        font.setPointSize(15)          # 比普通内容明显更大
-        font.setWeight(QFont.Bold)     # 使用更粗的字重
-        self.title_label.setFont(font)
+        self.title_label.setFont(self._title_font())
         self.title_label.setAlignment(Qt.AlignCenter | Qt.AlignVCenter)  # 居中显示
         
         layout.addStretch()  # 左侧弹性空间
@@ -72,19 +133,11 @@ class PanelHeader(QWidget):
         left_bar_color = self._left_bar_color or border_color
         text_color = self._text_color or Theme.PRIMARY
 
-        self.setStyleSheet(f"""
-            PanelHeader {{
-                background-color: {header_bg};
-                border-bottom: 2px solid {border_color};
-                border-left: 4px solid {left_bar_color};
-                border-top-left-radius: {Theme.BORDER_RADIUS}px;
-                border-top-right-radius: {Theme.BORDER_RADIUS}px;
-            }}
-            QLabel {{
-                color: {text_color};
-                background-color: transparent;
-            }}
-        """)
+        cache_key = f"panel_header:{header_bg}:{border_color}:{left_bar_color}:{text_color}"
+        self.setStyleSheet(Theme.cached_stylesheet(
+            cache_key,
+            lambda: _build_header_qss(header_bg, border_color, left_bar_color, text_color),
+        ))
     
     def set_title(self, title: str):
         """设置标题文本"""
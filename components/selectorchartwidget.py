@@ -21,8 +21,14 @@ class SelectorChartWidget(QWidget):
 
     def set_options(self, options: list):
         """设置选择项，如 ['Unit-0', 'Unit-1']"""
-        self.combobox.clear()
-        self.combobox.addItems(options)
+        # 不屏蔽信号：选中项变化需要通过 currentTextChanged 刷新图表；只暂停重绘
+        self.combobox.setUpdatesEnabled(False)
+        try:
+            self.combobox.clear()
+            self.combobox.addItems(options)
+        finally:
+            self.combobox.setUpdatesEnabled(True)
+            self.combobox.update()
 
     def set_chart_data_for_option(self, option_key: str, chart_data: dict):
         """为某个选项预设图表数据"""
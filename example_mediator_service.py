@@ -21,12 +21,17 @@
     controller = MainWindowController(mediator=mediator)
     controller.show()
 """
-import random
 import math
+import sys
+import threading
+from itertools import cycle
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
 from typing import Any as TypingAny
 
+import numpy as np
 from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtGui import QPen, QBrush, QColor
 from PyQt5.QtCore import Qt
@@ -36,6 +41,81 @@ from MultiAgentGUI.services.mediator_service import MediatorService
 from MultiAgentGUI.services.canvas_renderer import CanvasRenderer
 
 
+# 画布坐标只需要像素级精度，绘制时统一转换为 float32 数组，
+# 避免为每个点构造 Python float 列表（QPointF 等需要 double 的地方再在边界处转换）
+_COORD_DTYPE = np.float32
+
+# 智能体状态字符串统一使用驻留（interned）常量：热循环中的 == 比较可以直接命中身份比较快路径
+_STATUS_IDLE = sys.intern('idle')
+_STATUS_WORKING = sys.intern('working')
+_STATUS_CHARGING = sys.intern('charging')
+_STATUS_UNKNOWN = sys.intern('unknown')
+
+# 场景调色板/符号表：模块级元组只构建一次，字符串同样驻留，每帧生成场景时直接按下标取用
+# 己方（红军）颜色：红色系；敌方（蓝军）颜色：蓝色系
+_FRIENDLY_COLORS = tuple(map(sys.intern, ("#FF0000", "#FF4444", "#FF6666", "#FF8888", "#FFAAAA", "#FFCCCC")))
+_ENEMY_COLORS = tuple(map(sys.intern, ("#0000FF", "#4444FF", "#6666FF", "#8888FF", "#AAAAFF", "#CCCCFF")))
+# pyqtgraph支持的符号：'o'(circle), 's'(square), 't'(triangle), 'd'(diamond), '+'(plus)
+# 注意：避免使用matplotlib风格的符号如'^', 'v', 'D', 'p', '*', 'x'等
+_FRIENDLY_SYMBOLS = tuple(map(sys.intern, ('o', 's', 't', 'd', 's', 'o')))
+_ENEMY_SYMBOLS = tuple(map(sys.intern, ('+', 'd', 't', 's', 'o', '+')))
+_TARGET_COLOR = sys.intern('#223399')
+
+
+@dataclass(slots=True)
+class AgentRecord:
+    """
+    模拟智能体记录（内部存储用）
+
+    使用 slots 数据类代替 dict，字段访问走属性偏移，内存占用也更小。
+    对外接口（fetch_agent_data 等）仍然返回标准格式的 dict。
+    """
+    id: int
+    type: str
+    status: str
+    x: float
+    y: float
+    coalition_id: Optional[int] = None  # 敌方没有子群信息
+
+    def to_dict(self, faction: str) -> Dict[str, Any]:
+        """转换为 fetch_agent_data 约定的标准格式"""
+        return {
+            'id': self.id,
+            'type': self.type,
+            'coalition_id': self.coalition_id,
+            'status': self.status,
+            'faction': faction,
+            'x': self.x,
+            'y': self.y,
+        }
+
+
+@dataclass(slots=True)
+class TaskRecord:
+    """模拟任务记录（内部存储用）"""
+    id: int
+    type: str
+    area: str
+    coalition_id: int
+    status: str
+    start_time: float
+    duration: float
+    ltl: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为 fetch_task_data 约定的标准格式"""
+        return {
+            'id': self.id,
+            'type': self.type,
+            'area': self.area,
+            'coalition_id': self.coalition_id,
+            'status': self.status,
+            'start_time': self.start_time,
+            'duration': self.duration,
+            'ltl': self.ltl,
+        }
+
+
 class ExampleCanvasRenderer(CanvasRenderer):
     """
     示例绘制器实现
@@ -64,12 +144,7 @@ class ExampleCanvasRenderer(CanvasRenderer):
         state = self._init_canvas_state(canvas)
         
         # 获取场景限制
-        limits = scene_data.get("limits", {
-            "x_min": self.mediator.SCENE_X_MIN,
-            "x_max": self.mediator.SCENE_X_MAX,
-            "y_min": self.mediator.SCENE_Y_MIN,
-            "y_max": self.mediator.SCENE_Y_MAX,
-        })
+        limits = scene_data.get("limits") or self.mediator.SCENE_LIMITS
         
         # 设置背景图
         bg_path = self.mediator._get_background_image_path()
@@ -108,12 +183,7 @@ class ExampleCanvasRenderer(CanvasRenderer):
         
         # 获取场景限制
         scene_data = self.mediator.fetch_simulation_scene()
-        limits = scene_data.get("limits", {
-            "x_min": self.mediator.SCENE_X_MIN,
-            "x_max": self.mediator.SCENE_X_MAX,
-            "y_min": self.mediator.SCENE_Y_MIN,
-            "y_max": self.mediator.SCENE_Y_MAX,
-        })
+        limits = scene_data.get("limits") or self.mediator.SCENE_LIMITS
         
         # 使用 mediator 的背景设置方法
         self.mediator._set_canvas_background(state, background_path, limits)
@@ -155,11 +225,40 @@ class ExampleMediatorService(MediatorService):
     SCENE_Y_MIN = 0.0
     SCENE_Y_MAX = 56.0  # 背景图的实际高度
     
+    # 场景坐标范围（只读映射）：每帧生成场景数据及各处取默认值时复用同一对象，不再重复构造字典
+    SCENE_LIMITS = MappingProxyType({
+        'x_min': SCENE_X_MIN,
+        'x_max': SCENE_X_MAX,
+        'y_min': SCENE_Y_MIN,
+        'y_max': SCENE_Y_MAX,
+    })
+    
+    # 智能体位移小于该阈值（场景单位，约为亚像素）时认为画面无变化，跳过重绘
+    REDRAW_EPSILON = 0.05
+    
+    # 任务模板：名称 → 详细内容（instruction文本）。模板是静态数据，只构建一次
+    TASK_TEMPLATES = {
+        "标准巡逻任务": "在指定区域进行标准巡逻任务，确保区域安全。巡逻路径：从起点A到终点B，途经关键检查点C、D、E。",
+        "区域侦察任务": "对目标区域进行详细侦察，收集情报信息。侦察范围：坐标(10,20)到(50,60)的矩形区域。",
+        "目标搜索任务": "搜索并定位指定目标。目标特征：红色标记，移动速度中等。搜索区域：半径100米范围内。",
+        "紧急救援任务": "执行紧急救援任务，前往坐标(30,40)救援被困人员。优先级：高。预计耗时：30分钟。",
+        "物资运输任务": "将物资从起点(0,0)运输到终点(100,100)。物资类型：医疗用品。运输方式：无人机运输。"
+    }
+    
     def __init__(self):
         """初始化模拟数据"""
         super().__init__()  # 调用父类初始化，设置 _ui_callbacks
         self._current_time = 0.0
         self._simulation_running = False
+        # receive_command（及其中触发的 notify_* -> fetch_*）在线程池工作线程中执行，
+        # step_simulation 在 GUI 线程执行；两者共享的仿真状态（运行标志、时间、智能体、任务）由该锁保护
+        self._state_lock = threading.RLock()
+        # 场景版本号：场景有可见变化时递增，前端据此跳过未变化场景的重绘
+        self._scene_version = 0
+        # 最近一次构建的场景数据：(场景版本, 场景字典)，版本未变时 fetch_simulation_scene 直接复用
+        self._scene_cache: Optional[tuple] = None
+        # 随机数生成器：每个时间步批量生成所需的随机数，避免逐个调用 random 模块
+        self._rng = np.random.default_rng()
 
         # 绑定到前端视图的引用（可选，GenericSimulationCanvas 实例）
         self._sim_view_canvas = None
@@ -170,6 +269,10 @@ class ExampleMediatorService(MediatorService):
         # 绘制器实例（延迟初始化）
         self._renderer: Optional[ExampleCanvasRenderer] = None
         
+        # 上一次递增场景版本时的智能体位置和状态快照（用于判断是否有可见变化）
+        self._last_rendered_positions: Optional[np.ndarray] = None
+        self._last_rendered_statuses: Optional[tuple] = None
+        
         # 初始化模拟数据
         self._init_mock_data()
     
@@ -232,39 +335,40 @@ class ExampleMediatorService(MediatorService):
         # 己方（红军）智能体：包含完整的子群信息和状态
         # 注意：y 坐标范围限制在 [0, 56] 以匹配背景图区域
         self._friendly_agents = [
-            {'id': 1, 'type': '侦察型无人机', 'coalition_id': 0, 'status': 'working', 'x': 20, 'y': 15},
-            {'id': 2, 'type': '攻击型无人机', 'coalition_id': 0, 'status': 'working', 'x': 25, 'y': 18},
-            {'id': 3, 'type': '运输型无人机', 'coalition_id': 0, 'status': 'working', 'x': 22, 'y': 16},
-            {'id': 4, 'type': '侦察型无人机', 'coalition_id': 1, 'status': 'working', 'x': 60, 'y': 35},
-            {'id': 5, 'type': '攻击型无人机', 'coalition_id': 1, 'status': 'working', 'x': 65, 'y': 38},
-            {'id': 6, 'type': '侦察型无人机', 'coalition_id': 2, 'status': 'idle', 'x': 40, 'y': 25},
-            {'id': 7, 'type': '攻击型无人机', 'coalition_id': 2, 'status': 'idle', 'x': 45, 'y': 28},
-            {'id': 8, 'type': '运输型无人机', 'coalition_id': 2, 'status': 'charging', 'x': 50, 'y': 25},
-            {'id': 9, 'type': '侦察型无人机', 'coalition_id': 2, 'status': 'idle', 'x': 42, 'y': 26},
+            AgentRecord(id=1, type='侦察型无人机', coalition_id=0, status=_STATUS_WORKING, x=20, y=15),
+            AgentRecord(id=2, type='攻击型无人机', coalition_id=0, status=_STATUS_WORKING, x=25, y=18),
+            AgentRecord(id=3, type='运输型无人机', coalition_id=0, status=_STATUS_WORKING, x=22, y=16),
+            AgentRecord(id=4, type='侦察型无人机', coalition_id=1, status=_STATUS_WORKING, x=60, y=35),
+            AgentRecord(id=5, type='攻击型无人机', coalition_id=1, status=_STATUS_WORKING, x=65, y=38),
+            AgentRecord(id=6, type='侦察型无人机', coalition_id=2, status=_STATUS_IDLE, x=40, y=25),
+            AgentRecord(id=7, type='攻击型无人机', coalition_id=2, status=_STATUS_IDLE, x=45, y=28),
+            AgentRecord(id=8, type='运输型无人机', coalition_id=2, status=_STATUS_CHARGING, x=50, y=25),
+            AgentRecord(id=9, type='侦察型无人机', coalition_id=2, status=_STATUS_IDLE, x=42, y=26),
         ]
         
         # 敌方（蓝军）智能体：不包含子群信息，状态可能未知或不完整
         # 注意：y 坐标范围限制在 [0, 56] 以匹配背景图区域
         self._enemy_agents = [
-            {'id': 10, 'type': '侦察型无人机', 'status': 'unknown', 'x': 10, 'y': 5},
-            {'id': 11, 'type': '攻击型无人机', 'status': 'unknown', 'x': 15, 'y': 8},
-            {'id': 12, 'type': '侦察型无人机', 'status': 'unknown', 'x': 80, 'y': 10},
-            {'id': 13, 'type': '攻击型无人机', 'status': 'unknown', 'x': 85, 'y': 12},
+            AgentRecord(id=10, type='侦察型无人机', status=_STATUS_UNKNOWN, x=10, y=5),
+            AgentRecord(id=11, type='攻击型无人机', status=_STATUS_UNKNOWN, x=15, y=8),
+            AgentRecord(id=12, type='侦察型无人机', status=_STATUS_UNKNOWN, x=80, y=10),
+            AgentRecord(id=13, type='攻击型无人机', status=_STATUS_UNKNOWN, x=85, y=12),
         ]
         
         # 任务数据
         self._tasks = [
-            {'id': 1, 'type': 'patrol', 'area': 'A1', 'coalition_id': 0, 'status': 'executing', 
-             'start_time': 5, 'duration': 5, 'ltl': 'G (p1 -> F p2)'},
-            {'id': 2, 'type': 'surveillance', 'area': 'B2', 'coalition_id': 0, 'status': 'pending',
-             'start_time': 10, 'duration': 5, 'ltl': 'G (p2 -> X p3)'},
-            {'id': 3, 'type': 'search', 'area': 'C3', 'coalition_id': 1, 'status': 'executing',
-             'start_time': 6, 'duration': 6, 'ltl': 'F (p4 & p5)'},
-            {'id': 4, 'type': 'transport', 'area': 'D4', 'coalition_id': 1, 'status': 'pending',
-             'start_time': 12, 'duration': 6, 'ltl': 'G (p6 -> F p7)'},
-            {'id': 5, 'type': 'rescue', 'area': 'E5', 'coalition_id': -1, 'status': 'pending',
-             'start_time': 0, 'duration': 0, 'ltl': 'G (p8 -> X p9)'},
+            TaskRecord(id=1, type='patrol', area='A1', coalition_id=0, status='executing',
+                       start_time=5, duration=5, ltl='G (p1 -> F p2)'),
+            TaskRecord(id=2, type='surveillance', area='B2', coalition_id=0, status='pending',
+                       start_time=10, duration=5, ltl='G (p2 -> X p3)'),
+            TaskRecord(id=3, type='search', area='C3', coalition_id=1, status='executing',
+                       start_time=6, duration=6, ltl='F (p4 & p5)'),
+            TaskRecord(id=4, type='transport', area='D4', coalition_id=1, status='pending',
+                       start_time=12, duration=6, ltl='G (p6 -> F p7)'),
+            TaskRecord(id=5, type='rescue', area='E5', coalition_id=-1, status='pending',
+                       start_time=0, duration=0, ltl='G (p8 -> X p9)'),
         ]
+        self._rebuild_task_id_cache()
         
         # 场景数据
         # 注意：y 坐标范围限制在 [0, 56] 以匹配背景图区域
@@ -290,33 +394,27 @@ class ExampleMediatorService(MediatorService):
         """
         # 合并己方和敌方智能体数据（为了保持接口兼容性）
         # 添加faction字段以便服务层区分
-        all_agents = []
-        for agent in self._friendly_agents:
-            agent_copy = agent.copy()
-            agent_copy['faction'] = '红军'
-            all_agents.append(agent_copy)
-        for agent in self._enemy_agents:
-            agent_copy = agent.copy()
-            agent_copy['faction'] = '蓝军'
-            agent_copy['coalition_id'] = None  # 敌方没有子群信息
-            all_agents.append(agent_copy)
-        
-        return {
-            'coalitions': self._coalitions.copy(),
-            'agents': all_agents,
-            'current_time': self._current_time
-        }
+        with self._state_lock:
+            all_agents = [agent.to_dict('红军') for agent in self._friendly_agents]
+            all_agents.extend(agent.to_dict('蓝军') for agent in self._enemy_agents)
+            
+            return {
+                'coalitions': self._coalitions.copy(),
+                'agents': all_agents,
+                'current_time': self._current_time
+            }
     
     def fetch_task_data(self) -> Dict[str, Any]:
         """获取Task相关数据"""
         # 组合所有任务的LTL公式
-        ltl_formula = ' & '.join([f"({task['ltl']})" for task in self._tasks])
-        
-        return {
-            'tasks': self._tasks.copy(),
-            'ltl_formula': ltl_formula,
-            'current_time': self._current_time
-        }
+        with self._state_lock:
+            ltl_formula = ' & '.join([f"({task.ltl})" for task in self._tasks])
+            
+            return {
+                'tasks': [task.to_dict() for task in self._tasks],
+                'ltl_formula': ltl_formula,
+                'current_time': self._current_time
+            }
     
     def fetch_simulation_scene(self, timestamp: float = None) -> Dict[str, Any]:
         """
@@ -325,11 +423,15 @@ class ExampleMediatorService(MediatorService):
         注意：Agent位置的更新应该在 step_simulation() 中进行，
         这里只负责返回当前时刻的场景数据。
         如果传入timestamp参数，可以查询历史时刻的数据（回放功能）。
+        查询当前时刻时，场景版本未变化则返回同一个字典（调用方只读使用，不应修改）。
         """
         if timestamp is not None:
             # 如果指定了时间戳，可以用于回放历史数据
             # 这里简化处理，直接使用当前时间
             pass
+        elif self._scene_cache is not None and self._scene_cache[0] == self._scene_version:
+            # 场景版本未变（没有可见变化），复用上次构建的场景数据
+            return self._scene_cache[1]
         
         # 注意：Agent位置的更新在 step_simulation() 中完成
         # 这里不需要再次更新，避免重复计算
@@ -337,33 +439,25 @@ class ExampleMediatorService(MediatorService):
         # 构建场景数据
         agents = []
         
-        # 己方（红军）颜色：红色系
-        friendly_colors = ["#FF0000", "#FF4444", "#FF6666", "#FF8888", "#FFAAAA", "#FFCCCC"]
-        # 敌方（蓝军）颜色：蓝色系
-        enemy_colors = ["#0000FF", "#4444FF", "#6666FF", "#8888FF", "#AAAAFF", "#CCCCFF"]
-        # pyqtgraph支持的符号：'o'(circle), 's'(square), 't'(triangle), 'd'(diamond), '+'(plus)
-        # 注意：避免使用matplotlib风格的符号如'^', 'v', 'D', 'p', '*', 'x'等
-        friendly_symbols = ['o', 's', 't', 'd', 's', 'o']
-        enemy_symbols = ['+', 'd', 't', 's', 'o', '+']
-        
+        # 调色板/符号表与智能体按顺序循环配对，省去逐个下标取模
         # 处理己方智能体
-        for i, agent in enumerate(self._friendly_agents):
+        for agent, color, symbol in zip(self._friendly_agents, cycle(_FRIENDLY_COLORS), cycle(_FRIENDLY_SYMBOLS)):
             agents.append({
-                'id': agent['id'],
-                'x': agent['x'],
-                'y': agent['y'],
-                'color': friendly_colors[i % len(friendly_colors)],
-                'symbol': friendly_symbols[i % len(friendly_symbols)]
+                'id': agent.id,
+                'x': agent.x,
+                'y': agent.y,
+                'color': color,
+                'symbol': symbol
             })
         
         # 处理敌方智能体
-        for i, agent in enumerate(self._enemy_agents):
+        for agent, color, symbol in zip(self._enemy_agents, cycle(_ENEMY_COLORS), cycle(_ENEMY_SYMBOLS)):
             agents.append({
-                'id': agent['id'],
-                'x': agent['x'],
-                'y': agent['y'],
-                'color': enemy_colors[i % len(enemy_colors)],
-                'symbol': enemy_symbols[i % len(enemy_symbols)]
+                'id': agent.id,
+                'x': agent.x,
+                'y': agent.y,
+                'color': color,
+                'symbol': symbol
             })
         
         targets = []
@@ -371,43 +465,42 @@ class ExampleMediatorService(MediatorService):
             targets.append({
                 'x': target['x'],
                 'y': target['y'],
-                'color': '#223399',
+                'color': _TARGET_COLOR,
                 'active': target['active']
             })
         
         # 生成轨迹数据（从Agent当前位置到目标）
         # 通常只为己方智能体生成轨迹
         trajectories = []
-        for i, agent in enumerate(self._friendly_agents):
-            if agent['status'] == 'working' and i < 3:  # 只为前3个工作中的己方智能体生成轨迹
+        # 只为前3个己方智能体中处于工作状态的生成轨迹（下标小于调色板长度，无需取模）
+        for i, agent in enumerate(self._friendly_agents[:3]):
+            if agent.status == _STATUS_WORKING:
                 # 找到对应的目标
-                target_idx = agent['id'] % len(self._targets)
+                target_idx = agent.id % len(self._targets)
                 target = self._targets[target_idx]
                 
                 # 生成轨迹点
                 points = self._generate_trajectory_points(
-                    (agent['x'], agent['y']),
+                    (agent.x, agent.y),
                     (target['x'], target['y']),
                     10  # 10个点
                 )
                 trajectories.append({
                     'points': points,
-                    'color': friendly_colors[i % len(friendly_colors)]
+                    'color': _FRIENDLY_COLORS[i]
                 })
         
-        return {
+        scene = {
             'agents': agents,
             'targets': targets,
             'regions': self._regions.copy(),
             'trajectories': trajectories,
             'time': self._current_time,
-            'limits': {
-                'x_min': self.SCENE_X_MIN,
-                'x_max': self.SCENE_X_MAX,
-                'y_min': self.SCENE_Y_MIN,
-                'y_max': self.SCENE_Y_MAX  # 匹配背景图的实际区域高度
-            }
+            'limits': self.SCENE_LIMITS,
         }
+        if timestamp is None:
+            self._scene_cache = (self._scene_version, scene)
+        return scene
 
     # ---------- 与前端视图的轻量集成（基于 GenericSimulationCanvas） ----------
     def bind_simulation_views(self, simulation_view_panel, simulation_design_panel) -> None:
@@ -446,12 +539,7 @@ class ExampleMediatorService(MediatorService):
 
         # 构造一份当前场景数据，用于初始化 limits 和矢量图
         scene_data = self.fetch_simulation_scene()
-        limits = scene_data.get("limits", {
-            "x_min": self.SCENE_X_MIN,
-            "x_max": self.SCENE_X_MAX,
-            "y_min": self.SCENE_Y_MIN,
-            "y_max": self.SCENE_Y_MAX,  # 匹配背景图的实际区域高度
-        })
+        limits = scene_data.get("limits") or self.SCENE_LIMITS
 
         # 获取背景图路径
         bg_path_str = self._get_background_image_path()
@@ -547,12 +635,7 @@ class ExampleMediatorService(MediatorService):
         
         # 更新所有画布的背景图
         scene_data = self.fetch_simulation_scene()
-        limits = scene_data.get("limits", {
-            "x_min": self.SCENE_X_MIN,
-            "x_max": self.SCENE_X_MAX,
-            "y_min": self.SCENE_Y_MIN,
-            "y_max": self.SCENE_Y_MAX,
-        })
+        limits = scene_data.get("limits") or self.SCENE_LIMITS
         
         # 为所有已绑定的画布设置新背景
         for state in self._canvas_states.values():
@@ -641,8 +724,6 @@ class ExampleMediatorService(MediatorService):
         if img.isNull():
             return
 
-        import numpy as np
-
         ptr = img.bits()
         ptr.setsize(img.byteCount())
         arr = np.array(ptr, dtype=np.uint8).reshape(img.height(), img.width(), 4)
@@ -719,9 +800,17 @@ class ExampleMediatorService(MediatorService):
         # Agents
         agents = scene.get("agents", [])
         if agents:
+            n = len(agents)
+            positions = scene.get("agent_positions")
+            if isinstance(positions, np.ndarray) and positions.shape == (n, 2):
+                # 后端直接提供坐标数组：按列取视图，无需逐个读取字典
+                xs, ys = positions[:, 0], positions[:, 1]
+            else:
+                xs = np.fromiter((a.get("x", 0.0) for a in agents), dtype=_COORD_DTYPE, count=n)
+                ys = np.fromiter((a.get("y", 0.0) for a in agents), dtype=_COORD_DTYPE, count=n)
             agents_item.setData(
-                x=[float(a.get("x", 0.0)) for a in agents],
-                y=[float(a.get("y", 0.0)) for a in agents],
+                x=xs,
+                y=ys,
                 brush=[pg.mkBrush(a.get("color", "#FF0000")) for a in agents],
                 symbol=[a.get("symbol", "o") for a in agents],
             )
@@ -732,10 +821,11 @@ class ExampleMediatorService(MediatorService):
         targets_src = scene.get("targets", [])
         targets = [t for t in targets_src if t.get("active", True)]
         if targets:
+            n = len(targets)
             targets_item.setData(
-                x=[float(t.get("x", 0.0)) for t in targets],
-                y=[float(t.get("y", 0.0)) for t in targets],
-                brush=[pg.mkBrush(t.get("color", "#223399")) for t in targets],
+                x=np.fromiter((t.get("x", 0.0) for t in targets), dtype=_COORD_DTYPE, count=n),
+                y=np.fromiter((t.get("y", 0.0) for t in targets), dtype=_COORD_DTYPE, count=n),
+                brush=[pg.mkBrush(t.get("color", _TARGET_COLOR)) for t in targets],
             )
         else:
             targets_item.clear()
@@ -789,13 +879,16 @@ class ExampleMediatorService(MediatorService):
             pts = traj.get("points", [])
             if len(pts) < 2:
                 continue
-            xs = [float(p[0]) for p in pts]
-            ys = [float(p[1]) for p in pts]
+            pts_arr = np.asarray(pts, dtype=_COORD_DTYPE)
             color = traj.get("color", "#FF0000")
             item = pg.PlotDataItem(
-                x=xs,
-                y=ys,
+                x=pts_arr[:, 0],
+                y=pts_arr[:, 1],
                 pen=pg.mkPen(color, width=2),
+                # 坐标来自 float32 数组，均为有限值，跳过逐点 isfinite 检查；
+                # 宽线条按线段批量绘制，比整条 QPainterPath 描边快
+                skipFiniteCheck=True,
+                segmentedLineMode='on',
             )
             item.setZValue(-400)
             canvas.addItem(item)
@@ -810,7 +903,8 @@ class ExampleMediatorService(MediatorService):
         instruction = command_data.get('instruction', '')
         
         if '开始' in instruction or 'start' in instruction.lower():
-            self._simulation_running = True
+            with self._state_lock:
+                self._simulation_running = True
             print("[ExampleMediatorService] 仿真已启动")
             
             # 示例：后端自己决定显示成功通知
@@ -821,7 +915,8 @@ class ExampleMediatorService(MediatorService):
                 duration=3000
             )
         elif '停止' in instruction or 'stop' in instruction.lower():
-            self._simulation_running = False
+            with self._state_lock:
+                self._simulation_running = False
             print("[ExampleMediatorService] 仿真已停止")
             
             # 示例：后端自己决定显示信息通知
@@ -839,34 +934,27 @@ class ExampleMediatorService(MediatorService):
                 notification_type="warning",
                 duration=5000
             )
+            # 任务列表可能变化，推送给任务面板
+            self.notify_task_data_changed()
         
         return True
     
     def get_task_templates(self) -> List[str]:
         """获取任务模板列表"""
-        return [
-            "标准巡逻任务",
-            "区域侦察任务",
-            "目标搜索任务",
-            "紧急救援任务",
-            "物资运输任务"
-        ]
+        return list(self.TASK_TEMPLATES)
     
     def get_task_template_content(self, template_name: str) -> str:
         """获取任务模板的详细内容（instruction文本）"""
-        template_contents = {
-            "标准巡逻任务": "在指定区域进行标准巡逻任务，确保区域安全。巡逻路径：从起点A到终点B，途经关键检查点C、D、E。",
-            "区域侦察任务": "对目标区域进行详细侦察，收集情报信息。侦察范围：坐标(10,20)到(50,60)的矩形区域。",
-            "目标搜索任务": "搜索并定位指定目标。目标特征：红色标记，移动速度中等。搜索区域：半径100米范围内。",
-            "紧急救援任务": "执行紧急救援任务，前往坐标(30,40)救援被困人员。优先级：高。预计耗时：30分钟。",
-            "物资运输任务": "将物资从起点(0,0)运输到终点(100,100)。物资类型：医疗用品。运输方式：无人机运输。"
-        }
         # 返回模板内容，如果模板不存在则返回模板名称
-        return template_contents.get(template_name, template_name)
+        return self.TASK_TEMPLATES.get(template_name, template_name)
     
     def get_task_ids(self) -> List[str]:
         """获取当前任务ID列表"""
-        return [str(task['id']) for task in self._tasks]
+        return list(self._task_ids_str)
+    
+    def _rebuild_task_id_cache(self) -> None:
+        """重建字符串形式的任务ID缓存（修改 self._tasks 后需调用）"""
+        self._task_ids_str = tuple(str(task.id) for task in self._tasks)
     
     def get_command_options(self) -> List[str]:
         """获取可用的命令选项列表"""
@@ -884,24 +972,23 @@ class ExampleMediatorService(MediatorService):
         返回标准化的任务图数据，只包含节点和边的简单结构。
         这里展示一个示例：任务1 -> 任务2，任务2 -> 任务3，任务1 -> 任务4，任务3 -> 任务4。
         """
+        # 可能在工作线程中被调用（notify_task_data_changed），先在锁内取任务快照
+        with self._state_lock:
+            tasks = tuple(self._tasks)
+        
         # 根据当前任务数据构建节点（只包含id和label）
-        nodes = []
-        for task in self._tasks:
-            task_id = task['id']
-            task_type = task.get('type', 'unknown')
-            task_type_label = self._get_task_type_label(task_type)
-            
-            nodes.append({
-                'id': task_id,
-                'label': f"T{task_id}: {task_type_label}"
-            })
+        label_of = self._get_task_type_label
+        nodes = [
+            {'id': task.id, 'label': f"T{task.id}: {label_of(task.type or 'unknown')}"}
+            for task in tasks
+        ]
         
         # 构建边（任务依赖关系）
         # 示例：
         # - 先后顺序关系（sequence）：任务1 -> 任务2，任务2 -> 任务3，任务3 -> 任务4
         # - 同时关系（parallel）：任务1 和 任务3 需要同时执行
         edges = []
-        task_ids = [task['id'] for task in self._tasks]
+        task_ids = frozenset(task.id for task in tasks)
         
         # 先后顺序关系（有箭头）
         # 任务1 -> 任务2（如果存在）
@@ -921,11 +1008,18 @@ class ExampleMediatorService(MediatorService):
         if 1 in task_ids and 3 in task_ids:
             edges.append({'source': 1, 'target': 3, 'type': 'parallel'})
         
+        # 布局缓存键：只由图结构（节点ID + 边）决定，结构不变时前端可直接复用上次的布局
+        structure_hash = hash((
+            tuple(node['id'] for node in nodes),
+            tuple((e['source'], e['target'], e['type']) for e in edges),
+        ))
+        
         return {
             'nodes': nodes,
             'edges': edges,
             'layout': {
-                'algorithm': 'hierarchical'  # 使用层次布局展示依赖关系
+                'algorithm': 'hierarchical',  # 使用层次布局展示依赖关系
+                'cache_key': format(structure_hash & 0xFFFFFFFFFFFFFFFF, 'x'),
             }
         }
     
@@ -942,59 +1036,69 @@ class ExampleMediatorService(MediatorService):
     
     def _update_agent_positions(self):
         """更新Agent位置（模拟移动）"""
+        rng = self._rng
+        
+        # 本时间步所需的随机数一次性批量生成
+        n_friendly = len(self._friendly_agents)
+        idle_rolls = rng.random(n_friendly).tolist()
+        idle_jitter = rng.uniform(-2, 2, (n_friendly, 2)).tolist()
+        
         # 更新己方智能体位置
-        for agent in self._friendly_agents:
-            if agent['status'] == 'working':
+        for agent, roll, (jx, jy) in zip(self._friendly_agents, idle_rolls, idle_jitter):
+            if agent.status == _STATUS_WORKING:
                 # 向目标移动
-                target_idx = agent['id'] % len(self._targets)
+                target_idx = agent.id % len(self._targets)
                 target = self._targets[target_idx]
                 
-                dx = target['x'] - agent['x']
-                dy = target['y'] - agent['y']
+                dx = target['x'] - agent.x
+                dy = target['y'] - agent.y
                 distance = math.sqrt(dx*dx + dy*dy)
                 
                 if distance > 1.0:  # 如果还没到达
                     # 移动速度
                     speed = 0.5
-                    agent['x'] += (dx / distance) * speed
-                    agent['y'] += (dy / distance) * speed
+                    agent.x += (dx / distance) * speed
+                    agent.y += (dy / distance) * speed
                     # 限制在背景图区域内
-                    agent['x'] = max(self.SCENE_X_MIN, min(self.SCENE_X_MAX, agent['x']))
-                    agent['y'] = max(self.SCENE_Y_MIN, min(self.SCENE_Y_MAX, agent['y']))
+                    agent.x = max(self.SCENE_X_MIN, min(self.SCENE_X_MAX, agent.x))
+                    agent.y = max(self.SCENE_Y_MIN, min(self.SCENE_Y_MAX, agent.y))
                 else:
-                    agent['status'] = 'idle'
-            elif agent['status'] == 'idle' and random.random() < 0.1:
+                    agent.status = _STATUS_IDLE
+            elif agent.status == _STATUS_IDLE and roll < 0.1:
                 # 随机移动（限制在背景图区域内）
-                agent['x'] += random.uniform(-2, 2)
-                agent['y'] += random.uniform(-2, 2)
-                agent['x'] = max(self.SCENE_X_MIN, min(self.SCENE_X_MAX, agent['x']))
-                agent['y'] = max(self.SCENE_Y_MIN, min(self.SCENE_Y_MAX, agent['y']))
+                agent.x += jx
+                agent.y += jy
+                agent.x = max(self.SCENE_X_MIN, min(self.SCENE_X_MAX, agent.x))
+                agent.y = max(self.SCENE_Y_MIN, min(self.SCENE_Y_MAX, agent.y))
         
         # 更新敌方智能体位置
-        for agent in self._enemy_agents:
-            # 敌方智能体：模拟观测到的移动（更随机，速度可能不同）
-            # 由于无法获取敌方完整信息，移动模式更不确定
-            if random.random() < 0.3:  # 30%概率移动
+        # 敌方智能体：模拟观测到的移动（更随机，速度可能不同）
+        # 由于无法获取敌方完整信息，移动模式更不确定
+        n_enemy = len(self._enemy_agents)
+        move_rolls = rng.random(n_enemy)
+        angles = rng.uniform(0, 2 * np.pi, n_enemy)
+        speeds = rng.uniform(0.2, 0.8, n_enemy)  # 速度不确定
+        # 30%概率移动，不移动的位移为 0
+        moving = move_rolls < 0.3
+        step_x = np.where(moving, np.cos(angles) * speeds, 0.0).tolist()
+        step_y = np.where(moving, np.sin(angles) * speeds, 0.0).tolist()
+        
+        for agent, moved, sx, sy in zip(self._enemy_agents, moving.tolist(), step_x, step_y):
+            if moved:
                 # 随机方向移动（限制在背景图区域内）
-                angle = random.uniform(0, 2 * math.pi)
-                speed = random.uniform(0.2, 0.8)  # 速度不确定
-                agent['x'] += math.cos(angle) * speed
-                agent['y'] += math.sin(angle) * speed
-                agent['x'] = max(self.SCENE_X_MIN, min(self.SCENE_X_MAX, agent['x']))
-                agent['y'] = max(self.SCENE_Y_MIN, min(self.SCENE_Y_MAX, agent['y']))
+                agent.x = max(self.SCENE_X_MIN, min(self.SCENE_X_MAX, agent.x + sx))
+                agent.y = max(self.SCENE_Y_MIN, min(self.SCENE_Y_MAX, agent.y + sy))
     
     def _update_trajectories(self):
         """更新轨迹（已通过fetch_simulation_scene中的逻辑实现）"""
         pass
     
-    def _generate_trajectory_points(self, start: tuple, end: tuple, num_points: int) -> List[List[float]]:
-        """生成轨迹点"""
-        points = []
-        for i in range(num_points):
-            t = i / (num_points - 1) if num_points > 1 else 0
-            x = start[0] + (end[0] - start[0]) * t
-            y = start[1] + (end[1] - start[1]) * t
-            points.append([x, y])
+    def _generate_trajectory_points(self, start: tuple, end: tuple, num_points: int) -> np.ndarray:
+        """生成轨迹点：返回形状 (num_points, 2) 的 float32 数组，绘制时可直接按列取用"""
+        t = np.linspace(0.0, 1.0, num_points, dtype=_COORD_DTYPE) if num_points > 1 else np.zeros(num_points, dtype=_COORD_DTYPE)
+        points = np.empty((num_points, 2), dtype=_COORD_DTYPE)
+        points[:, 0] = start[0] + (end[0] - start[0]) * t
+        points[:, 1] = start[1] + (end[1] - start[1]) * t
         return points
     
     def is_simulation_running(self) -> bool:
@@ -1008,29 +1112,67 @@ class ExampleMediatorService(MediatorService):
         注意：时间步长由后端决定，这里使用固定步长0.1秒。
         不同的后端实现可以使用不同的策略（固定步长、自适应步长等）。
         """
-        if not self._simulation_running:
-            return False
+        with self._state_lock:
+            if not self._simulation_running:
+                return False
+            
+            # 固定时间步长：0.1秒
+            time_step = 0.1
+            self._current_time += time_step
+            
+            # 更新Agent位置（基于新的时间步）
+            self._update_agent_positions()
+            # 位移不可见且状态未变时不递增版本，前端跳过本次重绘
+            if self._scene_changed():
+                self._scene_version += 1
         
-        # 固定时间步长：0.1秒
-        time_step = 0.1
-        self._current_time += time_step
+        # 主动推送数据变化，UI 无需轮询
+        # 任务数据中的 current_time 随时间步推进（任务甘特图的时间线），同样需要推送
+        self.notify_agent_data_changed()
+        self.notify_task_data_changed()
+        
+        return True
+    
+    def _scene_changed(self) -> bool:
+        """
+        与上一场景版本相比，智能体是否有可见变化
         
-        # 更新Agent位置（基于新的时间步）
-        self._update_agent_positions()
+        有状态变化或最大位移不小于 REDRAW_EPSILON 时返回 True 并更新快照；
+        快照只在版本递增时更新，小位移会累积到可见后再触发重绘。
+        """
+        agents = self._friendly_agents + self._enemy_agents
+        positions = np.array([(a.x, a.y) for a in agents], dtype=_COORD_DTYPE).reshape(-1, 2)
+        statuses = tuple(a.status for a in agents)
+        last = self._last_rendered_positions
+        if (
+            last is not None
+            and last.shape == positions.shape
+            and statuses == self._last_rendered_statuses
+            and float(np.abs(positions - last).max(initial=0.0)) < self.REDRAW_EPSILON
+        ):
+            return False
         
+        self._last_rendered_positions = positions
+        self._last_rendered_statuses = statuses
         return True
     
+    def get_scene_version(self) -> Optional[int]:
+        """获取场景版本号（由 step_simulation 递增）"""
+        return self._scene_version
+    
     def get_current_time(self) -> float:
         """获取当前仿真时间"""
         return self._current_time
     
     def start_simulation(self):
         """启动仿真"""
-        self._simulation_running = True
+        with self._state_lock:
+            self._simulation_running = True
     
     def stop_simulation(self):
         """停止仿真"""
-        self._simulation_running = False
+        with self._state_lock:
+            self._simulation_running = False
     
     def update_time(self, delta: float):
         """
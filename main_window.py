@@ -1,21 +1,17 @@
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add parent directory to path when running as script
-# This allows the script to find MultiAgentGUI module when run directly
-_script_file = Path(__file__).resolve()
-try:
-    _main_file = Path(sys.argv[0]).resolve()
-    # If this file is being run directly, add parent to path
-    if _script_file == _main_file:
-        parent_dir = _script_file.parent.parent
-        if str(parent_dir) not in sys.path:
-            sys.path.insert(0, str(parent_dir))
-except (IndexError, OSError):
-    # If sys.argv[0] is not available or path doesn't exist, skip
-    pass
-
-from PyQt5.QtCore import Qt, QTimer
+# This allows the script to find MultiAgentGUI module when run directly.
+# __name__ already tells us whether this module is the entry point,
+# so normal imports skip the filesystem path resolution entirely.
+if __name__ == "__main__":
+    _parent_dir = str(Path(__file__).resolve().parent.parent)
+    if _parent_dir not in sys.path:
+        sys.path.insert(0, _parent_dir)
+
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QGridLayout, QSizePolicy
 from qfluentwidgets import CardWidget
 
@@ -24,13 +20,28 @@ from MultiAgentGUI.panels import (
     TaskInfoPanel,
     AgentInfoPanel,
     CommandPanel,
-    SimulationViewPanel,
     SimulationDesignPanel,
     PlannerFloatingPanel,
 )
 from MultiAgentGUI.animations.transition import FadeTransitionManager
 from MultiAgentGUI.themes import Theme
 
+if TYPE_CHECKING:
+    from MultiAgentGUI.panels.simulation_view_panel import SimulationViewPanel
+
+
+def _build_main_window_qss() -> str:
+    # 在全局样式基础上，仅追加对 HomeInterface 根窗口背景色的补充，
+    # 避免对按钮等子控件做任何额外覆盖。
+    return (
+        Theme.get_global_stylesheet()
+        + f"""
+    QWidget#HomeInterface {{
+        background-color: {Theme.BACKGROUND};
+    }}
+    """
+    )
+
 
 class ViewMode:
     LAYOUT = "layout"
@@ -46,9 +57,27 @@ class MainWindow(QWidget):
     - 业务逻辑和 Mediator 交互由 MainWindowController 负责
     """
 
+    # 仿真视图面板在首次进入查看模式时才创建，创建后发出此信号（参数为 SimulationViewPanel）
+    sim_panel_created = pyqtSignal(object)
+
+    # 浮窗通知请求（消息, 类型, 时长ms）；Controller 以排队方式连接，保证在 GUI 线程中显示
+    notification_requested = pyqtSignal(str, str, int)
+
+    # Mediator 推送的数据变化（Agent 数据 / Task 数据, 任务图数据），同样以排队方式投递到 GUI 线程
+    agent_data_pushed = pyqtSignal(object)
+    task_data_pushed = pyqtSignal(object, object)
+
     def __init__(self, parent=None):
         super().__init__(parent=parent)
 
+        # 初始化过程中可能已触发尺寸/布局相关回调，先把后面才创建的部件置为 None，
+        # 回调里统一用 is not None 判断，而不是 hasattr
+        self.gridLayout = None
+        self._mode_button = None
+        self._planner_panel = None
+        # 最近一次定位后的按钮几何 (x, y, w, h)，规划器浮窗据此定位，无需重复计算
+        self._mode_button_geom = None
+
         # 基础属性，与原 UI_HomeInterface 中保持一致，方便复用样式表
         self.setObjectName("HomeInterface")
         # 调整默认窗口尺寸，让初始布局更舒展
@@ -59,6 +88,14 @@ class MainWindow(QWidget):
 
         self._mode = ViewMode.LAYOUT
         self._transition = FadeTransitionManager(self)
+        # 模式切换动画进行中的标志，防止连续点击产生交错的动画和重复布局
+        self._mode_switch_in_progress = False
+
+        # 拖动窗口边缘时 resizeEvent 会连续触发，用单次定时器合并为一次几何更新
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._apply_resize_geometry)
 
         self._init_panels()
         self._init_mode_button()
@@ -80,61 +117,81 @@ class MainWindow(QWidget):
         self.gridLayout.setSpacing(12)
         self.gridLayout.setContentsMargins(12, 12, 12, 12)
 
-        # 仿真区域容器
-        self.SimulationWidget = CardWidget(self)
-        self.SimulationWidget.setEnabled(True)
-        sp = QSizePolicy(QSizePolicy.MinimumExpanding, QSizePolicy.Expanding)
-        sp.setHorizontalStretch(0)
-        sp.setVerticalStretch(0)
-        self.SimulationWidget.setSizePolicy(sp)
-        self.SimulationWidget.setMinimumSize(500, 0)
-        self.SimulationWidget.setObjectName("SimulationWidget")
-
-        # 场景设计容器
-        self.SimulationScenarioWidget = CardWidget(self)
-        sp = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        sp.setHorizontalStretch(0)
-        sp.setVerticalStretch(0)
-        self.SimulationScenarioWidget.setSizePolicy(sp)
-        self.SimulationScenarioWidget.setMinimumSize(500, 0)
-        self.SimulationScenarioWidget.setObjectName("SimulationScenarioWidget")
-
-        # 命令输入容器
-        self.CommandWidget = CardWidget(self)
-        sp = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        sp.setHorizontalStretch(0)
-        sp.setVerticalStretch(0)
-        self.CommandWidget.setSizePolicy(sp)
-        # 与场景设计区域保持一致的最小宽度，避免看起来更窄
-        self.CommandWidget.setMinimumSize(500, 0)
-        self.CommandWidget.setObjectName("CommandWidget")
-
-        # 任务信息容器
-        self.TaskInfoWidget = CardWidget(self)
-        sp = QSizePolicy(QSizePolicy.MinimumExpanding, QSizePolicy.Expanding)
-        sp.setHorizontalStretch(0)
-        sp.setVerticalStretch(0)
-        self.TaskInfoWidget.setSizePolicy(sp)
-        # 与其它区域保持一致的最小宽度，避免右侧看起来更宽
-        self.TaskInfoWidget.setMinimumSize(500, 0)
-        self.TaskInfoWidget.setObjectName("TaskInfoWidget")
-
-        # 智能体信息容器
-        self.AgentInfoWidget = CardWidget(self)
-        sp = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        sp.setHorizontalStretch(0)
-        sp.setVerticalStretch(0)
-        self.AgentInfoWidget.setSizePolicy(sp)
-        self.AgentInfoWidget.setMinimumSize(500, 0)
-        self.AgentInfoWidget.setObjectName("AgentInfoWidget")
-
-        # 具体的行列布局在 _apply_mode_layout 中统一设置，这里只负责创建容器本身
+        # 五个 CardWidget 容器只有尺寸策略不同，两种策略对象共享（setSizePolicy 会复制）
+        sp_min_exp = QSizePolicy(QSizePolicy.MinimumExpanding, QSizePolicy.Expanding)
+        sp_exp_exp = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        card_specs = (
+            ("SimulationWidget", sp_min_exp),          # 仿真区域容器
+            ("SimulationScenarioWidget", sp_exp_exp),  # 场景设计容器
+            ("CommandWidget", sp_exp_exp),             # 命令输入容器
+            ("TaskInfoWidget", sp_min_exp),            # 任务信息容器
+            ("AgentInfoWidget", sp_exp_exp),           # 智能体信息容器
+        )
+        for name, size_policy in card_specs:
+            card = CardWidget(self)
+            card.setSizePolicy(size_policy)
+            card.setObjectName(name)
+            setattr(self, name, card)
+
+        # 各区域保持一致的最小宽度，避免左右两侧看起来宽窄不一。
+        # 仿真区域在布局模式下隐藏，其最小宽度在首次显示时（_ensure_sim_panel）再设置
+        for card in (
+            self.SimulationScenarioWidget,
+            self.CommandWidget,
+            self.TaskInfoWidget,
+            self.AgentInfoWidget,
+        ):
+            card.setMinimumSize(500, 0)
+
+        # 网格位置在这里一次性固定下来，两种模式下各面板的位置都不变：
+        # 被隐藏的面板不参与 QGridLayout 的布局计算，
+        # 因此 _apply_mode_layout 切换模式时只需要切换显隐。
+        #
+        # 逻辑网格：4 行 × 6 列，6 列拉伸相同，左侧 4 列 / 右侧 2 列 ≈ 2:1，高度 4 行平均分配
+        # 布局模式（左侧：配置相关；右侧：信息展示）
+        #   - 场景调整：左侧上 3 行 × 4 列（第 0-2 行, 第 0-3 列）
+        #   - 命令输入：左侧第 4 行 × 4 列（第 3 行, 第 0-3 列）
+        # 查看模式
+        #   - 仿真视图：左侧 4 行 × 4 列（第 0-3 行, 第 0-3 列），与上面两个面板重叠，但二者不同时可见
+        # 两种模式共用
+        #   - 任务信息：右侧上 2 行 × 2 列（第 0-1 行, 第 4-5 列）
+        #   - 智能体信息：右侧下 2 行 × 2 列（第 2-3 行, 第 4-5 列）
+        self.gridLayout.addWidget(self.SimulationScenarioWidget, 0, 0, 3, 4)
+        self.gridLayout.addWidget(self.CommandWidget, 3, 0, 1, 4)
+        self.gridLayout.addWidget(self.SimulationWidget, 0, 0, 4, 4)
+        self.gridLayout.addWidget(self.TaskInfoWidget, 0, 4, 2, 2)
+        self.gridLayout.addWidget(self.AgentInfoWidget, 2, 4, 2, 2)
+        for col in range(6):
+            self.gridLayout.setColumnStretch(col, 1)
+        for row in range(4):
+            self.gridLayout.setRowStretch(row, 1)
+
+        # 各模式下面板的可见性
+        self._mode_visibility = {
+            # 布局模式：不显示仿真主界面，仅用于配置场景与任务
+            ViewMode.LAYOUT: {
+                self.SimulationWidget: False,
+                self.SimulationScenarioWidget: True,
+                self.CommandWidget: True,
+                self.TaskInfoWidget: True,
+                self.AgentInfoWidget: True,
+            },
+            # 查看模式：仿真主视图 + 右侧信息栏
+            ViewMode.VIEW: {
+                self.SimulationWidget: True,
+                self.SimulationScenarioWidget: False,
+                self.CommandWidget: False,
+                self.TaskInfoWidget: True,
+                self.AgentInfoWidget: True,
+            },
+        }
 
     def _init_panels(self):
         """初始化各个功能面板"""
-        # 仿真结果查看：只读场景视图
-        self.sim_panel = SimulationViewPanel(title="仿真视图")
-            # 场景设计：可编辑场景视图（编辑逻辑由 MainWindowController 协调，Mediator 处理）
+        # 仿真结果查看：只读场景视图。
+        # 布局模式下不可见，延迟到首次进入查看模式时由 _ensure_sim_panel 创建
+        self.sim_panel = None
+        # 场景设计：可编辑场景视图（编辑逻辑由 MainWindowController 协调，Mediator 处理）
         self.sim_scenario_panel = SimulationDesignPanel(title="场景设置")
         # 使用真实的任务 / 智能体信息面板，替换占位面板
         self.task_panel = TaskInfoPanel()
@@ -143,17 +200,37 @@ class MainWindow(QWidget):
         self.command_panel = CommandPanel()
 
         # 将占位面板嵌入到 UI 容器中
-        self._setup_widget_container(self.SimulationWidget, self.sim_panel)
         self._setup_widget_container(self.SimulationScenarioWidget, self.sim_scenario_panel)
         self._setup_widget_container(self.TaskInfoWidget, self.task_panel)
         self._setup_widget_container(self.AgentInfoWidget, self.agent_panel)
         self._setup_widget_container(self.CommandWidget, self.command_panel)
 
+    def _ensure_sim_panel(self) -> "SimulationViewPanel":
+        """返回仿真视图面板，首次调用时创建并嵌入容器"""
+        if self.sim_panel is None:
+            # 仿真视图模块按需导入，启动时不加载
+            from MultiAgentGUI.panels.simulation_view_panel import SimulationViewPanel
+
+            self.SimulationWidget.setMinimumSize(500, 0)
+            self.sim_panel = SimulationViewPanel(title="仿真视图")
+            self._setup_widget_container(self.SimulationWidget, self.sim_panel)
+            self.sim_panel_created.emit(self.sim_panel)
+        return self.sim_panel
+
     def _setup_widget_container(self, container: QWidget, child: QWidget):
         """为容器设置统一的内边距和布局，并添加子部件"""
         layout = container.layout()
         if layout is None:
+            # 常见情况：新建的容器没有布局和子部件，直接创建布局即可
+            # （QVBoxLayout(container) 已把布局设置到容器上）
             layout = QVBoxLayout(container)
+        elif layout.count():
+            # 复用已有布局时才需要清理旧的子部件
+            while layout.count():
+                item = layout.takeAt(0)
+                w = item.widget()
+                if w is not None:
+                    w.deleteLater()
         layout.setContentsMargins(
             Theme.SPACING_MEDIUM,
             Theme.SPACING_MEDIUM,
@@ -161,13 +238,7 @@ class MainWindow(QWidget):
             Theme.SPACING_MEDIUM,
         )
         layout.setSpacing(Theme.SPACING_SMALL)
-        while layout.count():
-            item = layout.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.deleteLater()
         layout.addWidget(child)
-        container.setLayout(layout)
 
     # 注意：Mediator 绑定与数据刷新已移至 MainWindowController
     # MainWindow 只负责 UI 组装，不直接与 Mediator 交互
@@ -179,13 +250,23 @@ class MainWindow(QWidget):
         self._mode_button.setObjectName("PrimaryActionButton")
         self._mode_button.setCursor(Qt.PointingHandCursor)
         self._mode_button.clicked.connect(self._toggle_mode)
+        # 稍微放大字体，由字体控制而不是覆盖样式表；字体只设置一次，切换模式时只改文字
+        button_font = self._mode_button.font()
+        button_font.setPointSize(11)
+        button_font.setBold(True)
+        self._mode_button.setFont(button_font)
         self._update_mode_button_text()
         self._position_mode_button()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        # 重新计时，等尺寸稳定后再统一更新按钮和浮窗位置
+        self._resize_timer.start()
+
+    def _apply_resize_geometry(self):
+        """窗口尺寸变化后，重新定位右下角按钮和规划器浮窗"""
         self._position_mode_button()
-        if hasattr(self, '_planner_panel') and self._planner_panel.isVisible():
+        if self._planner_panel is not None and self._planner_panel.isVisible():
             self._position_planner_panel()
 
     def _position_mode_button(self):
@@ -197,6 +278,7 @@ class MainWindow(QWidget):
         x = self.width() - btn_w - margin
         y = self.height() - btn_h - margin
         self._mode_button.setGeometry(x, y, btn_w, btn_h)
+        self._mode_button_geom = (x, y, btn_w, btn_h)
     
     def _init_planner_floating_panel(self):
         """初始化规划器选择浮窗"""
@@ -210,13 +292,11 @@ class MainWindow(QWidget):
     
     def _position_planner_panel(self):
         """定位规划器浮窗，放在开始仿真按钮的左边"""
-        if not hasattr(self, '_mode_button') or not hasattr(self, '_planner_panel'):
+        if self._planner_panel is None or self._mode_button_geom is None:
             return
         
-        margin = 24
-        btn_w = 220
-        btn_x = self.width() - btn_w - margin
-        btn_y = self.height() - 44 - margin  # 按钮高度是 44
+        # 直接复用 _position_mode_button 缓存的按钮坐标
+        btn_x, btn_y, _, _ = self._mode_button_geom
         
         # 使用 panel 的 update_position 方法
         self._planner_panel.update_position(self.width(), self.height(), btn_x, btn_y)
@@ -227,134 +307,89 @@ class MainWindow(QWidget):
             self._mode_button.setText("开始仿真（切换到查看模式）")
         else:
             self._mode_button.setText("暂停仿真（切换到布局模式）")
-        # 稍微放大字体，由字体控制而不是覆盖样式表
-        font = self._mode_button.font()
-        font.setPointSize(11)
-        font.setBold(True)
-        self._mode_button.setFont(font)
 
     # --- 模式切换 ---
     def _toggle_mode(self):
         """点击按钮在布局模式 / 查看模式之间切换"""
-        self._mode = ViewMode.VIEW if self._mode == ViewMode.LAYOUT else ViewMode.LAYOUT
-
-        # 参与动画的所有面板
-        all_panels = [
-            self.SimulationWidget,
-            self.SimulationScenarioWidget,
-            self.CommandWidget,
-            self.TaskInfoWidget,
-            self.AgentInfoWidget,
-        ]
-
-        # 第 0 阶段：先隐藏/显示规划器浮窗（立即执行，不参与动画）
-        if hasattr(self, '_planner_panel'):
-            if self._mode == ViewMode.VIEW:
-                # 切换到查看模式：先隐藏浮窗
-                self._planner_panel.hide()
-            # 注意：浮窗的显示会在 _after_fade_out 中延迟执行
-
-        # 第 1 阶段：让当前可见的面板统一慢慢淡出
-        currently_visible = [w for w in all_panels if w.isVisible()]
-
-        def _after_fade_out():
-            # 中间阶段：切换到目标模式的布局
-            self._apply_mode_layout()
-            self._update_mode_button_text()
-
-            # 根据新模式下的可见性，决定要淡入哪些面板
-            target_visible = [w for w in all_panels if w.isVisible()]
+        # 上一次切换的动画还没结束时忽略本次点击
+        if self._mode_switch_in_progress:
+            return
+        self._mode_switch_in_progress = True
 
-            # 第 2 阶段：让新布局中的面板淡入出现
-            self._transition.fade_widgets(to_show=target_visible, to_hide=[])
+        self._mode = ViewMode.VIEW if self._mode == ViewMode.LAYOUT else ViewMode.LAYOUT
+        self._update_mode_button_text()
 
-            # 第 3 阶段：如果是布局模式，延迟显示浮窗（在其他面板淡入之后）
-            if self._mode == ViewMode.LAYOUT and hasattr(self, '_planner_panel'):
-                QTimer.singleShot(300, lambda: self._planner_panel.show())  # 延迟300ms显示
+        # 切换到查看模式：先隐藏规划器浮窗（立即执行，不参与动画）
+        if self._mode == ViewMode.VIEW:
+            self._planner_panel.hide()
+            self._ensure_sim_panel()
+
+        # 只有显隐发生变化的面板参与动画；两种模式下都可见的面板保持不动。
+        # 新旧面板占据相同的网格区域，淡出和淡入在同一个动画组里同时进行（交叉淡化），
+        # 总时长为单次淡入/淡出的时长，而不是两者之和。
+        target_visibility = self._mode_visibility[self._mode]
+        to_hide = [w for w, visible in target_visibility.items() if not visible and w.isVisible()]
+        to_show = [w for w, visible in target_visibility.items() if visible and not w.isVisible()]
+
+        def _after_cross_fade():
+            # 动画结束：按新模式统一校正显隐，如果是布局模式再显示浮窗
+            try:
+                if self._mode == ViewMode.LAYOUT:
+                    self._planner_panel.show()
+                self._apply_mode_layout()
+            finally:
+                self._mode_switch_in_progress = False
 
         self._transition.fade_widgets(
-            to_show=[],
-            to_hide=currently_visible,
-            finished_callback=_after_fade_out,
+            to_show=to_show,
+            to_hide=to_hide,
+            finished_callback=_after_cross_fade,
         )
 
     def _apply_mode_layout(self):
         """
-        根据当前模式调整各面板的可见性与布局权重。
-        先实现基础的"显隐 + 拉伸因子"切换，后续再加动画。
+        根据当前模式调整各面板的可见性。
+        网格位置与拉伸因子在 _build_base_layout 中一次性设置，这里只切换显隐。
         """
-        if not hasattr(self, "gridLayout"):
+        if self.gridLayout is None:
             return
         
         # 注意：规划器浮窗的显示/隐藏已在 _toggle_mode 中处理
         # 这里只负责定位（如果浮窗可见的话）
-        if hasattr(self, '_planner_panel') and self._planner_panel.isVisible():
+        if self._planner_panel is not None and self._planner_panel.isVisible():
             self._position_planner_panel()
 
-        if self._mode == ViewMode.LAYOUT:
-            # 布局模式：不显示仿真主界面，仅用于配置场景与任务
-            self.SimulationWidget.setVisible(False)
-            self.SimulationScenarioWidget.setVisible(True)
-            self.CommandWidget.setVisible(True)
-            self.TaskInfoWidget.setVisible(True)
-            self.AgentInfoWidget.setVisible(True)
-
-            # 逻辑网格：4 行 × 6 列
-            # 左侧（0-3 列）：配置相关
-            #   - 场景调整：左侧上 3 行 × 4 列（第 0-2 行, 第 0-3 列）
-            #   - 命令输入：左侧第 4 行 × 4 列（第 3 行, 第 0-3 列）
-            # 右侧（4-5 列）：信息展示
-            #   - 任务信息：右侧上 2 行 × 2 列（第 0-1 行, 第 4-5 列）
-            #   - 智能体信息：右侧下 2 行 × 2 列（第 2-3 行, 第 4-5 列）
-            self.gridLayout.addWidget(self.SimulationScenarioWidget, 0, 0, 3, 4)
-            self.gridLayout.addWidget(self.CommandWidget, 3, 0, 1, 4)
-            self.gridLayout.addWidget(self.TaskInfoWidget, 0, 4, 2, 2)
-            self.gridLayout.addWidget(self.AgentInfoWidget, 2, 4, 2, 2)
-
-            # 列、行拉伸均匀，左侧 4 列 / 右侧 2 列 ≈ 2:1，高度 4 行平均分配
-            for col in range(6):
-                self.gridLayout.setColumnStretch(col, 1)
-            for row in range(4):
-                self.gridLayout.setRowStretch(row, 1)
-        else:
-            # 查看模式：
-            # 逻辑上将网格视为 2 行 x 6 列：
-            # - 仿真主视图占据左侧 2 行 x 4 列（第0-1行, 第0-3列）
-            # - 任务信息占据右上 1 行 x 2 列（第0行, 第4-5列）
-            # - 智能体信息占据右下 1 行 x 2 列（第1行, 第4-5列）
-            self.SimulationWidget.setVisible(True)
-            self.SimulationScenarioWidget.setVisible(False)
-            self.CommandWidget.setVisible(False)
-            self.TaskInfoWidget.setVisible(True)
-            self.AgentInfoWidget.setVisible(True)
-
-            # 仿真视图：4 行 × 4 列
-            self.gridLayout.addWidget(self.SimulationWidget, 0, 0, 4, 4)
-            # 任务信息：上方 2 行 × 2 列
-            self.gridLayout.addWidget(self.TaskInfoWidget, 0, 4, 2, 2)
-            # 智能体信息：下方 2 行 × 2 列
-            self.gridLayout.addWidget(self.AgentInfoWidget, 2, 4, 2, 2)
-
-            # 设置 6 列的拉伸比例全部相同：
-            # 列宽相等时，仿真视图占 4 列、信息栏占 2 列 → 宽度约为 2:1
-            for col in range(6):
-                self.gridLayout.setColumnStretch(col, 1)
-
-            # 行拉伸使用 Qt 默认行为，让两行自动按内容和跨行情况分配高度
+        # 所有显隐修改放在同一个批次里，只触发一次重新布局和重绘
+        panels = (
+            self.SimulationWidget,
+            self.SimulationScenarioWidget,
+            self.CommandWidget,
+            self.TaskInfoWidget,
+            self.AgentInfoWidget,
+        )
+        if self._mode == ViewMode.VIEW:
+            self._ensure_sim_panel()
+
+        self.setUpdatesEnabled(False)
+        was_blocked = [(w, w.blockSignals(True)) for w in panels]
+        try:
+            self._apply_mode_visibility()
+        finally:
+            for w, blocked in was_blocked:
+                w.blockSignals(blocked)
+            self.setUpdatesEnabled(True)
+            self.updateGeometry()
+
+    def _apply_mode_visibility(self):
+        """按当前模式切换各面板的显隐（网格位置已在 _build_base_layout 中固定）"""
+        for widget, visible in self._mode_visibility[self._mode].items():
+            if widget.isVisibleTo(self) != visible:
+                widget.setVisible(visible)
 
     # --- 主题 ---
     def _apply_theme(self):
         """应用与旧主窗口一致的主题设置"""
-        base_styles = Theme.get_global_stylesheet()
-        # 在全局样式基础上，仅追加对 HomeInterface 根窗口背景色的补充，
-        # 避免对按钮等子控件做任何额外覆盖。
-        self.setStyleSheet(
-            base_styles
-            + f"""
-            QWidget#HomeInterface {{
-                background-color: {Theme.BACKGROUND};
-            }}
-            """
-        )
-
-
+        stylesheet = Theme.cached_stylesheet("main_window", _build_main_window_qss)
+        # 内容相同则不再 setStyleSheet，避免 Qt 重新解析整份样式表
+        if self.styleSheet() != stylesheet:
+            self.setStyleSheet(stylesheet)
@@ -5,7 +5,7 @@ MainWindow 控制器（UI 协调层）
 - UI 生命周期管理：创建、显示、隐藏、关闭 MainWindow
 - UI 事件绑定：连接 UI 信号到 Mediator 方法
 - UI 操作：文件对话框、UI 定时器等
-- 数据刷新协调：定时从 Mediator 拉取数据并更新 UI
+- 数据刷新协调：接收 Mediator 推送的数据变化（定时拉取兜底）并更新 UI
 - 模板加载：从 Mediator 获取模板数据并设置到 UI
 
 架构设计：
@@ -32,28 +32,51 @@ MainWindow 控制器（UI 协调层）
 └─────────────────────────────────────────────────────────┘
 """
 import sys
+from collections import deque
 from pathlib import Path
 from typing import Optional, Dict, Callable
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtWidgets import QFileDialog
+from qfluentwidgets import InfoBar, InfoBarPosition, InfoBarIcon
 
 # Add parent directory to path when running as script
-# This allows the script to find MultiAgentGUI module when run directly
-_script_file = Path(__file__).resolve()
-try:
-    _main_file = Path(sys.argv[0]).resolve()
-    # If this file is being run directly, add parent to path
-    if _script_file == _main_file:
-        parent_dir = _script_file.parent.parent
-        if str(parent_dir) not in sys.path:
-            sys.path.insert(0, str(parent_dir))
-except (IndexError, OSError):
-    # If sys.argv[0] is not available or path doesn't exist, skip
-    pass
+# This allows the script to find MultiAgentGUI module when run directly.
+# __name__ already tells us whether this module is the entry point,
+# so normal imports skip the filesystem path resolution entirely.
+if __name__ == "__main__":
+    _parent_dir = str(Path(__file__).resolve().parent.parent)
+    if _parent_dir not in sys.path:
+        sys.path.insert(0, _parent_dir)
 
 from MultiAgentGUI.services.mediator_service import MediatorService
 from MultiAgentGUI.main_window import MainWindow
 
 
+class _CommandSignals(QObject):
+    """命令执行结果信号（在 GUI 线程创建，工作线程发出后排队回到 GUI 线程）"""
+    finished = pyqtSignal(bool)
+    failed = pyqtSignal(str)
+
+
+class _CommandRunnable(QRunnable):
+    """在线程池中调用 mediator.receive_command，避免后端耗时阻塞界面"""
+    
+    def __init__(self, handler: Callable[[Dict], bool], command_data: Dict, signals: _CommandSignals):
+        super().__init__()
+        self._handler = handler
+        self._command_data = command_data
+        self._signals = signals
+    
+    def run(self):
+        success = False
+        try:
+            success = bool(self._handler(self._command_data))
+        except Exception as e:
+            # 工作线程中不能直接操作界面，异常信息经排队信号交给 GUI 线程以浮窗提示
+            self._signals.failed.emit(str(e))
+        self._signals.finished.emit(success)
+
+
 class MainWindowController:
     """
     MainWindow 控制器（UI 协调层）
@@ -86,21 +109,45 @@ class MainWindowController:
         """
         self.mediator = mediator
         self._data_timer: Optional[QTimer] = None
+        self._simulation_timer: Optional[QTimer] = None
+        # 上一次重绘仿真画布时的场景版本（None 表示 Mediator 不提供版本，每步都重绘）
+        self._rendered_scene_version: Optional[int] = None
+        # Mediator 方法探测结果缓存：{method_name: bool}，仅对 _method_cache_owner 有效
+        self._method_cache: Dict[str, bool] = {}
+        self._method_cache_owner: Optional[MediatorService] = None
+        # 已完成信号绑定的 mediator，避免重复调用 setup_bindings 时重复连接
+        self._bound_mediator: Optional[MediatorService] = None
+        # 正在线程池中执行的命令（其结果信号对象），同一时间只允许一条命令在途
+        self._command_in_flight: Optional[_CommandSignals] = None
+        # 在途期间到达的命令（例如快速双击时已排队的第二次发送），按顺序依次执行，不丢弃
+        self._pending_commands: deque = deque()
         
         # 创建 MainWindow（由 Controller 管理，不传入 mediator）
         self.main_window = MainWindow(parent=parent)
         
         # 连接规划器选择事件到 Controller
         # 注意：_planner_panel 在 MainWindow.__init__ 中已初始化
-        if hasattr(self.main_window, '_planner_panel'):
+        if self.main_window._planner_panel is not None:
             self.main_window._planner_panel.planner_selected.connect(
                 self.handle_planner_selection
             )
         
+        # 通知请求通过排队信号投递到 GUI 线程，Mediator 可以从任意线程调用 show_notification
+        self.main_window.notification_requested.connect(
+            self._show_notification_impl, type=Qt.QueuedConnection
+        )
+        self.main_window.agent_data_pushed.connect(
+            self._apply_pushed_agent_data, type=Qt.QueuedConnection
+        )
+        self.main_window.task_data_pushed.connect(
+            self._apply_pushed_task_data, type=Qt.QueuedConnection
+        )
+        
         # 如果提供了 mediator，进行绑定
         if self.mediator is not None:
             self.setup_bindings()
             self.start_data_refresh()
+            self.start_simulation_loop()
     
     def show(self):
         """显示主窗口"""
@@ -113,6 +160,7 @@ class MainWindowController:
     def close(self):
         """关闭主窗口并清理资源"""
         self.stop_data_refresh()
+        self.stop_simulation_loop()
         self.main_window.close()
     
     def setup_bindings(self):
@@ -123,9 +171,15 @@ class MainWindowController:
         - 连接 UI 信号到 Mediator 方法
         - 不处理数据格式转换（由 Mediator 负责）
         - 不处理后端操作（由 Mediator 负责）
+        
+        注意：
+        - 转发到 Mediator 的 UI 信号使用 Qt.QueuedConnection，
+          Mediator 的处理推迟到下一轮事件循环执行，不阻塞当前的绘制和输入处理
+        - 同一个 mediator 只绑定一次，重复调用不会产生重复连接
         """
-        if self.mediator is None:
+        if self.mediator is None or self._bound_mediator is self.mediator:
             return
+        self._bound_mediator = self.mediator
         
         # 绑定仿真视图和场景设计视图（数据绘制：Mediator负责）
         self._bind_simulation_views()
@@ -161,6 +215,15 @@ class MainWindowController:
         - Controller 负责调用绘制器，但不知道具体绘制细节
         - 不同后端可以实现完全不同的绘制逻辑
         """
+        # 仿真视图面板延迟创建：创建时再绑定
+        self.main_window.sim_panel_created.connect(self._on_sim_panel_created)
+        
+        self._render_initial_scene(self.main_window.sim_scenario_panel)
+        if self.main_window.sim_panel is not None:
+            self._render_initial_scene(self.main_window.sim_panel)
+    
+    def _render_initial_scene(self, panel) -> None:
+        """使用 Mediator 的绘制器在指定面板的画布上渲染初始场景"""
         if not self._check_mediator_method('get_canvas_renderer'):
             return
         
@@ -171,10 +234,8 @@ class MainWindowController:
                 return
             
             # 获取画布组件
-            sim_canvas = self.main_window.sim_panel.get_canvas()
-            design_canvas = self.main_window.sim_scenario_panel.get_canvas()
-            
-            if sim_canvas is None or design_canvas is None:
+            canvas = panel.get_canvas()
+            if canvas is None:
                 self._log_error("获取画布", Exception("画布组件为 None"))
                 return
             
@@ -185,12 +246,29 @@ class MainWindowController:
                 scene_data = {}
             
             # 使用绘制器渲染初始场景
-            renderer.render_initial_scene(sim_canvas, scene_data)
-            renderer.render_initial_scene(design_canvas, scene_data)
+            renderer.render_initial_scene(canvas, scene_data)
             
         except Exception as e:
             self._log_error("绑定仿真视图", e)
     
+    def _on_sim_panel_created(self, sim_panel) -> None:
+        """仿真视图面板首次创建后，渲染初始场景并连接交互事件"""
+        self._render_initial_scene(sim_panel)
+        self._connect_sim_view_events(sim_panel)
+    
+    def _connect_sim_view_events(self, sim_panel) -> None:
+        """连接仿真视图的交互事件到 Mediator"""
+        if not self._check_mediator_method('handle_design_scene_event'):
+            return
+        
+        try:
+            sim_panel.scene_interaction.connect(
+                self.mediator.handle_design_scene_event,
+                type=Qt.QueuedConnection,
+            )
+        except Exception as e:
+            self._log_error("连接 scene_interaction", e)
+    
     def _bind_scene_events(self):
         """
         绑定场景交互事件
@@ -205,18 +283,15 @@ class MainWindowController:
         # 场景设计面板的编辑事件
         try:
             self.main_window.sim_scenario_panel.scene_edit_requested.connect(
-                self.mediator.handle_design_scene_event
+                self.mediator.handle_design_scene_event,
+                type=Qt.QueuedConnection,
             )
         except Exception as e:
             self._log_error("连接 scene_edit_requested", e)
         
-        # 仿真视图的交互事件
-        try:
-            self.main_window.sim_panel.scene_interaction.connect(
-                self.mediator.handle_design_scene_event
-            )
-        except Exception as e:
-            self._log_error("连接 scene_interaction", e)
+        # 仿真视图的交互事件（面板尚未创建时，在 _on_sim_panel_created 中连接）
+        if self.main_window.sim_panel is not None:
+            self._connect_sim_view_events(self.main_window.sim_panel)
     
     def _bind_toolbar_events(self):
         """
@@ -254,7 +329,6 @@ class MainWindowController:
             return
         
         # Controller 负责：UI 操作（文件对话框）
-        from PyQt5.QtWidgets import QFileDialog
         file_path, _ = QFileDialog.getOpenFileName(
             self.main_window,
             "选择背景图",
@@ -282,7 +356,6 @@ class MainWindowController:
             return
         
         # Controller 负责：UI 操作（文件对话框）
-        from PyQt5.QtWidgets import QFileDialog
         file_path, _ = QFileDialog.getOpenFileName(
             self.main_window,
             "选择矢量图",
@@ -311,11 +384,53 @@ class MainWindowController:
         
         try:
             self.main_window.command_panel.command_sent.connect(
-                self.mediator.receive_command
+                self._on_command_sent,
+                type=Qt.QueuedConnection,
             )
         except Exception as e:
             self._log_error("连接 command_sent", e)
     
+    def _on_command_sent(self, command_data: Dict):
+        """
+        在线程池中把命令交给 Mediator，界面不等待后端返回
+        
+        执行期间禁用发送按钮；按钮禁用前已排队的命令（如快速双击）进入等待队列，
+        由 _on_command_finished 依次执行，全部结束后恢复按钮。
+        队列中的命令都是用户逐条确认发送的指令，不做合并或去重。
+        """
+        if self.mediator is None:
+            return
+        if self._command_in_flight is not None:
+            self._pending_commands.append(command_data)
+            return
+        self._start_command(command_data)
+    
+    def _start_command(self, command_data: Dict):
+        """在线程池中执行一条命令，执行期间禁用发送按钮"""
+        signals = _CommandSignals()
+        signals.failed.connect(self._on_command_failed, type=Qt.QueuedConnection)
+        signals.finished.connect(self._on_command_finished, type=Qt.QueuedConnection)
+        self._command_in_flight = signals
+        self.main_window.command_panel.send_button.setEnabled(False)
+        QThreadPool.globalInstance().start(
+            _CommandRunnable(self.mediator.receive_command, command_data, signals)
+        )
+    
+    def _on_command_failed(self, message: str):
+        """命令执行抛出异常（GUI 线程）：以错误浮窗提示用户"""
+        self._show_notification(f"执行命令失败: {message}", "error", 5000)
+    
+    def _on_command_finished(self, success: bool):
+        """命令执行结束（GUI 线程）：执行下一条排队的命令，队列为空时恢复发送按钮"""
+        self._command_in_flight = None
+        if not success:
+            print("[MainWindowController] Mediator 未能处理命令")
+        if self._pending_commands and self.mediator is not None:
+            self._start_command(self._pending_commands.popleft())
+            return
+        self._pending_commands.clear()
+        self.main_window.command_panel.send_button.setEnabled(True)
+    
     def _load_templates(self):
         """
         加载任务模板到命令面板
@@ -350,7 +465,7 @@ class MainWindowController:
             return
         
         # 确保 planner_panel 已初始化
-        if not hasattr(self.main_window, '_planner_panel'):
+        if self.main_window._planner_panel is None:
             return
         
         if not self._check_mediator_method('get_planner_options'):
@@ -362,17 +477,20 @@ class MainWindowController:
         except Exception as e:
             self._log_error("加载规划器选项", e)
     
-    def start_data_refresh(self, interval: int = 1000):
+    def start_data_refresh(self, interval: int = 5000):
         """
-        启动定时器，周期性从 mediator 拉取数据并刷新面板
+        启动兜底定时器，周期性从 mediator 拉取数据并刷新面板
         
         职责边界：
         - Controller：管理 UI 定时器，定时触发数据刷新（协调）
         - Mediator：提供标准格式数据（数据提供）
         - Controller：将标准格式数据传递给 UI 显示（协调）
         
+        注意：数据变化时 Mediator 应通过 'agent_data_changed' / 'task_data_changed'
+        UI回调主动推送；定时拉取只作为兜底，数据未变化时由面板自身的变化检测跳过刷新。
+        
         参数：
-            interval: 刷新间隔（毫秒），默认 1000ms
+            interval: 刷新间隔（毫秒），默认 5000ms
         """
         if self.mediator is None:
             return
@@ -388,6 +506,79 @@ class MainWindowController:
             self._data_timer.stop()
             self._data_timer = None
     
+    def start_simulation_loop(self, interval: int = 100):
+        """
+        启动仿真推进定时器（默认 10 Hz）
+        
+        职责边界：
+        - Controller：定时触发 step_simulation，并用绘制器刷新仿真画布（协调）
+        - Mediator：决定时间步长、推进仿真状态、提供场景数据和场景版本
+        
+        参数：
+            interval: 推进间隔（毫秒），默认 100ms
+        """
+        if self.mediator is None:
+            return
+        
+        self._simulation_timer = QTimer(self.main_window)
+        self._simulation_timer.setInterval(interval)
+        self._simulation_timer.timeout.connect(self._on_simulation_tick)
+        self._simulation_timer.start()
+    
+    def stop_simulation_loop(self):
+        """停止仿真推进定时器"""
+        if self._simulation_timer is not None:
+            self._simulation_timer.stop()
+            self._simulation_timer = None
+    
+    def _on_simulation_tick(self):
+        """仿真运行时推进一个时间步，推进成功后刷新仿真画布"""
+        if not self._check_mediator_method('step_simulation'):
+            return
+        
+        try:
+            if not self.mediator.is_simulation_running():
+                return
+            if not self.mediator.step_simulation():
+                return
+        except Exception as e:
+            self._log_error("推进仿真", e)
+            return
+        
+        self._refresh_simulation_scene()
+    
+    def _refresh_simulation_scene(self):
+        """
+        用 Mediator 的绘制器把当前场景画到已创建的仿真画布上
+        
+        Mediator 通过 get_scene_version() 提供场景版本时，版本与上次重绘相同
+        说明场景没有可见变化，直接跳过获取场景数据和重绘。
+        """
+        if not self._check_mediator_method('get_canvas_renderer'):
+            return
+        
+        try:
+            version = None
+            if self._check_mediator_method('get_scene_version'):
+                version = self.mediator.get_scene_version()
+            if version is not None and version == self._rendered_scene_version:
+                return
+            
+            renderer = self.mediator.get_canvas_renderer()
+            if renderer is None:
+                return
+            
+            scene_data = self.mediator.fetch_simulation_scene()
+            for panel in (self.main_window.sim_scenario_panel, self.main_window.sim_panel):
+                if panel is None:
+                    continue
+                canvas = panel.get_canvas()
+                if canvas is not None:
+                    renderer.render_scene_update(canvas, scene_data)
+            self._rendered_scene_version = version
+        except Exception as e:
+            self._log_error("刷新仿真场景", e)
+    
     def _refresh_panels(self):
         """
         从 mediator 获取最新数据并刷新各个信息面板
@@ -404,7 +595,7 @@ class MainWindowController:
         if self._check_mediator_method('fetch_agent_data'):
             try:
                 agent_data = self.mediator.fetch_agent_data()
-                self.main_window.agent_panel.load_data(agent_data)
+                self._apply_agent_data(agent_data)
             except Exception as e:
                 self._log_error("刷新 Agent 数据", e)
         
@@ -420,10 +611,71 @@ class MainWindowController:
                     except Exception as e:
                         self._log_error("获取任务图数据", e)
                 
-                self.main_window.task_panel.load_data(task_data, graph_data)
+                self._apply_task_data(task_data, graph_data)
             except Exception as e:
                 self._log_error("刷新 Task 数据", e)
     
+    def _apply_agent_data(self, agent_data: Dict) -> None:
+        """将 Agent 数据交给面板显示（数据未变化时由面板跳过刷新）"""
+        # AgentInfoPanel.load_data 只记录数据并启动合并定时器，无需包裹
+        self.main_window.agent_panel.load_data(agent_data)
+    
+    def _apply_task_data(self, task_data: Dict, graph_data: Optional[Dict] = None) -> None:
+        """将 Task 数据交给面板显示（数据未变化时由面板跳过刷新）"""
+        self._load_panel_batched(self.main_window.task_panel, task_data, graph_data)
+    
+    @staticmethod
+    def _load_panel_batched(panel, *args) -> None:
+        """
+        在关闭重绘的窗口内调用 panel.load_data（用于同步刷新多个子视图的任务面板），
+        表格、甘特图、LTL 和任务图更新期间不逐个重绘，结束后统一刷新一次
+        """
+        panel.setUpdatesEnabled(False)
+        panel.blockSignals(True)
+        try:
+            panel.load_data(*args)
+        finally:
+            panel.blockSignals(False)
+            panel.setUpdatesEnabled(True)
+            panel.update()
+    
+    def _on_agent_data_changed(self, agent_data: Dict) -> None:
+        """
+        Mediator 推送 Agent 数据变化（UI操作回调 'agent_data_changed'）
+        
+        参数：
+            agent_data: 与 fetch_agent_data() 返回格式相同的标准数据
+        
+        可从非 GUI 线程调用（例如在 receive_command 中推送），数据经排队信号在 GUI 线程中加载
+        """
+        self.main_window.agent_data_pushed.emit(agent_data)
+    
+    def _apply_pushed_agent_data(self, agent_data: Dict) -> None:
+        """在 GUI 线程中加载推送的 Agent 数据"""
+        try:
+            self._apply_agent_data(agent_data)
+        except Exception as e:
+            self._log_error("推送刷新 Agent 数据", e)
+    
+    def _on_task_data_changed(self, task_data: Dict, graph_data: Optional[Dict] = None) -> None:
+        """
+        Mediator 推送 Task 数据变化（UI操作回调 'task_data_changed'）
+        
+        参数：
+            task_data: 与 fetch_task_data() 返回格式相同的标准数据
+            graph_data: 与 get_task_graph_data() 返回格式相同的任务图数据（可选）
+        
+        可从非 GUI 线程调用，数据经排队信号在 GUI 线程中加载
+        """
+        self.main_window.task_data_pushed.emit(task_data, graph_data)
+    
+    def _apply_pushed_task_data(self, task_data: Dict, graph_data: Optional[Dict]) -> None:
+        """在 GUI 线程中加载推送的 Task 数据"""
+        try:
+            self._apply_task_data(task_data, graph_data)
+        except Exception as e:
+            self._log_error("推送刷新 Task 数据", e)
+    
     def handle_planner_selection(self, faction: str, planner_name: str):
         """
         处理规划器选择变化
@@ -449,11 +701,15 @@ class MainWindowController:
             message: 通知消息内容
             notification_type: 通知类型 ("info", "success", "warning", "error")
             duration: 显示时长（毫秒），默认3000ms
+        
+        可从非 GUI 线程调用：这里只发出排队信号并立即返回，
+        实际的 InfoBar 在 GUI 线程中由 _show_notification_impl 创建。
         """
+        self.main_window.notification_requested.emit(message, notification_type, duration)
+    
+    def _show_notification_impl(self, message: str, notification_type: str, duration: int):
+        """在 GUI 线程中创建浮窗通知"""
         try:
-            from qfluentwidgets import InfoBar, InfoBarPosition, InfoBarIcon
-            from PyQt5.QtCore import Qt
-            
             icon_map = {
                 "info": InfoBarIcon.INFORMATION,
                 "success": InfoBarIcon.SUCCESS,
@@ -484,6 +740,8 @@ class MainWindowController:
         """
         return {
             'show_notification': self._show_notification,
+            'agent_data_changed': self._on_agent_data_changed,
+            'task_data_changed': self._on_task_data_changed,
             # 未来可以扩展其他UI操作：
             # 'show_dialog': self._show_dialog,
             # 'update_status_bar': self._update_status_bar,
@@ -522,11 +780,22 @@ class MainWindowController:
             required: 是否为必需方法（如果是必需但未实现，会打印警告）
         
         返回：方法是否存在
+        
+        注意：探测结果按 mediator 实例缓存，mediator 被替换时缓存自动失效
         """
         if self.mediator is None:
             return False
         
+        if self._method_cache_owner is not self.mediator:
+            self._method_cache.clear()
+            self._method_cache_owner = self.mediator
+        
+        has_method = self._method_cache.get(method_name)
+        if has_method is not None:
+            return has_method
+        
         has_method = hasattr(self.mediator, method_name)
+        self._method_cache[method_name] = has_method
         if not has_method and required:
             print(f"[MainWindowController] 警告: mediator 未实现必需方法 '{method_name}'")
         return has_method
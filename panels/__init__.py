@@ -3,7 +3,6 @@ from MultiAgentGUI.panels.task_panel import TaskInfoPanel
 from MultiAgentGUI.panels.agent_panel import AgentInfoPanel
 from MultiAgentGUI.panels.command_panel import CommandPanel
 from MultiAgentGUI.panels.placeholder_panel import PlaceholderPanel
-from MultiAgentGUI.panels.simulation_view_panel import SimulationViewPanel
 from MultiAgentGUI.panels.simulation_design_panel import SimulationDesignPanel
 from MultiAgentGUI.panels.planner_floating_panel import PlannerFloatingPanel
 
@@ -17,3 +16,10 @@ __all__ = [
     'PlannerFloatingPanel',
 ]
 
+
+def __getattr__(name):
+    # 仿真视图面板只在首次进入查看模式时才需要，按需导入（PEP 562）
+    if name == 'SimulationViewPanel':
+        from MultiAgentGUI.panels.simulation_view_panel import SimulationViewPanel
+        return SimulationViewPanel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
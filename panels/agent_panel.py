@@ -1,13 +1,14 @@
 # panels/agent_panel.py
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QWidget, QVBoxLayout
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from MultiAgentGUI.components.navi_panel import NavigationPanel
 from MultiAgentGUI.components.generic_tablewidget import GenericTableWidget
 from MultiAgentGUI.components.generic_ganntwidget import GenericGanttChart
 from MultiAgentGUI.components.selectorchartwidget import SelectorChartWidget
 from MultiAgentGUI.components.panel_header import PanelHeader
 from MultiAgentGUI.themes import Theme
-from MultiAgentGUI.adapters.agent_data_adapter import AgentDataAdapter
+from MultiAgentGUI.adapters.agent_data_adapter import AgentDataAdapter, AgentView
 
 
 class AgentInfoPanel(QWidget):
@@ -25,14 +26,7 @@ class AgentInfoPanel(QWidget):
         layout.setSpacing(0)
         
         # 添加标题栏：颜色使用 Theme 中为智能体面板配置的 header 颜色
-        self.header = PanelHeader(
-            "智能体信息",
-            bg_color=Theme.PANEL_AGENT_HEADER_BG,
-            border_color=Theme.PANEL_AGENT_HEADER_BORDER,
-            left_bar_color=Theme.PANEL_AGENT_HEADER_BORDER,
-            # 标题文字使用智能体面板的主题深色，而不是全局主文字色
-            text_color=Theme.PANEL_AGENT_HEADER_BORDER,
-        )
+        self.header = PanelHeader.for_agent("智能体信息")
         layout.addWidget(self.header)
         
         # 创建内容区域
@@ -63,6 +57,24 @@ class AgentInfoPanel(QWidget):
         self.nav.add_page(self.unit_gantt, "unit_gantt", "子群甘特图")
         self.nav.add_page(self.replan_gantt, "replan_gantt", "子群重规划甘特图")
 
+        # 上一次加载的展示数据，新视图与其逐项比较，只刷新变化的子组件
+        self._view: Optional[AgentView] = None
+
+        # 短时间内连续到达的数据只保留最后一份，50ms 内最多重建一次
+        self._pending_data: Optional[Dict[str, Any]] = None
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_load)
+
+        # 甘特图重绘开销最大：所在页面不可见时只记录待绘制的数据，切换到该页面时再绘制
+        self._pending_unit_gantt: Optional[Dict[str, Any]] = None
+        self._pending_replan: Optional[Tuple[tuple, Dict[str, Dict[str, Any]]]] = None
+        # 重规划甘特图：上次设置的选项以及每个选项的数据签名
+        self._replan_opts_sig: Optional[tuple] = None
+        self._replan_sig: Dict[str, int] = {}
+        self.nav.stacked_widget.currentChanged.connect(self._on_page_changed)
+
     def load_data(self, data: Dict[str, Any]):
         """
         从中介服务标准格式数据加载Agent数据并显示
@@ -74,23 +86,88 @@ class AgentInfoPanel(QWidget):
                 'agents': [...],
                 'current_time': float
             }
+        
+        实际加载延迟到 50ms 的单次定时器触发时执行，期间到达的新数据会覆盖旧数据
         """
-        # 使用适配器转换数据
-        coalition_data = AgentDataAdapter.convert_coalition_table_data(data.get('coalitions', []))
-        self.coalition_table.set_table_data(coalition_data)
+        self._pending_data = data
+        # 定时器未运行时才启动：持续推送时仍然每 50ms 加载一次最新数据，而不是被不断推迟
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _do_load(self):
+        """加载最近一次通过 load_data 提交的数据"""
+        data = self._pending_data
+        self._pending_data = None
+        if data is None:
+            return
+
+        view = AgentDataAdapter.build_view(data)
+        last = self._view
+        self._view = view
+        if view == last:
+            return
+
+        # 只刷新与上次相比发生变化的子组件
+        if last is None or view.coalitions != last.coalitions:
+            self.coalition_table.set_table_data(view.coalitions)
         
-        friendly_data = AgentDataAdapter.convert_friendly_agent_table_data(data.get('agents', []))
-        self.friendly_agent_table.set_table_data(friendly_data)
+        if last is None or view.friendly != last.friendly:
+            self.friendly_agent_table.set_table_data(view.friendly)
         
-        enemy_data = AgentDataAdapter.convert_enemy_agent_table_data(data.get('agents', []))
-        self.enemy_agent_table.set_table_data(enemy_data)
+        if last is None or view.enemy != last.enemy:
+            self.enemy_agent_table.set_table_data(view.enemy)
+        
+        # 昂贵的甘特图重绘按页面可见性延迟
+        if last is None or view.unit_gantt != last.unit_gantt:
+            self._pending_unit_gantt = view.unit_gantt
+            self._flush_unit_gantt()
+        
+        if (last is None or view.replan_options != last.replan_options
+                or view.replan_data != last.replan_data):
+            self._pending_replan = (view.replan_options, view.replan_data)
+            self._flush_replan()
+
+    def _is_current_page(self, widget: QWidget) -> bool:
+        return self.nav.stacked_widget.currentWidget() is widget
+
+    def _on_page_changed(self, index: int):
+        """切换导航页面时，绘制该页面上积压的甘特图数据"""
+        self._flush_unit_gantt()
+        self._flush_replan()
+
+    def _flush_unit_gantt(self):
+        """子群甘特图页面可见且有待绘制数据时才重绘"""
+        if self._pending_unit_gantt is None or not self._is_current_page(self.unit_gantt):
+            return
+        unit_gantt_data = self._pending_unit_gantt
+        self._pending_unit_gantt = None
         
-        unit_gantt_data = AgentDataAdapter.convert_unit_gantt_data(data)
         self.unit_gantt.update_plot(unit_gantt_data)
+
+    def _flush_replan(self):
+        """重规划甘特图页面可见且有待绘制数据时才刷新"""
+        if self._pending_replan is None or not self._is_current_page(self.replan_gantt):
+            return
+        replan_options, replan_data_map = self._pending_replan
+        self._pending_replan = None
         
-        replan_options = AgentDataAdapter.get_replan_options(data.get('coalitions', []))
-        self.replan_gantt.set_options(replan_options)
+        # 选项列表未变化时不重建下拉框
+        options_rebuilt = replan_options != self._replan_opts_sig
+        if options_rebuilt:
+            self.replan_gantt.set_options(list(replan_options))
+            self._replan_opts_sig = replan_options
         
-        replan_data_map = AgentDataAdapter.convert_replan_gantt_data(data)
+        # 只推送数据发生变化的选项
+        changed = set()
         for option_key, gantt_data in replan_data_map.items():
-            self.replan_gantt.set_chart_data_for_option(option_key, gantt_data)
+            sig = hash(repr(gantt_data))
+            if sig != self._replan_sig.get(option_key):
+                self.replan_gantt.set_chart_data_for_option(option_key, gantt_data)
+                self._replan_sig[option_key] = sig
+                changed.add(option_key)
+        
+        # set_chart_data_for_option 只保存数据，图表只在选中项切换时重绘：
+        # 选项重建（首次加载时数据尚未就绪）或当前选中项的数据变化时，需要主动重绘
+        current = self.replan_gantt.combobox.currentText()
+        if (options_rebuilt or current in changed) and current in replan_data_map:
+            self.replan_gantt.chart.update_plot(replan_data_map[current])
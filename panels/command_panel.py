@@ -1,5 +1,5 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import pyqtSignal, QSignalBlocker
 from qfluentwidgets import BodyLabel, PlainTextEdit, ComboBox
 from datetime import datetime
 from typing import Dict, Any
@@ -8,6 +8,10 @@ from MultiAgentGUI.components.panel_header import PanelHeader
 from MultiAgentGUI.themes import Theme
 
 
+# 绑定到模块级名称，生成命令时省去属性查找
+_now = datetime.now
+
+
 class CommandPanel(QWidget):
     """
     精简版命令面板，仅提供两行结构：
@@ -22,6 +26,9 @@ class CommandPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # 上一次设置的模板选项，选项未变化时跳过下拉框重建
+        self._last_publish_templates: tuple = ()
+        self._last_modify_templates: tuple = ()
         self._init_ui()
 
     def _init_ui(self):
@@ -30,13 +37,7 @@ class CommandPanel(QWidget):
         root_layout.setSpacing(0)
 
         # Header：复用统一的 PanelHeader 风格
-        header = PanelHeader(
-            "命令输入",
-            bg_color=Theme.PANEL_COMMAND_HEADER_BG,
-            border_color=Theme.PANEL_COMMAND_HEADER_BORDER,
-            left_bar_color=Theme.PANEL_COMMAND_HEADER_BORDER,
-            text_color=Theme.PANEL_COMMAND_HEADER_BORDER,
-        )
+        header = PanelHeader.for_command("命令输入")
         root_layout.addWidget(header)
 
         # 内容区域背景
@@ -156,13 +157,11 @@ class CommandPanel(QWidget):
             selected_template = self.modify_template_combo.currentText()
         
         # 构建标准化的命令数据
-        command_data = {
-            "type": command_type,
-            "instruction": instruction_text,
-            "template": selected_template if selected_template else None,
-            "timestamp": datetime.now().isoformat(),
-            "source": "gui"
-        }
+        command_data = self._make_command(
+            type=command_type,
+            instruction=instruction_text,
+            template=selected_template if selected_template else None,
+        )
         
         # 发送命令信号
         self.command_sent.emit(command_data)
@@ -170,6 +169,16 @@ class CommandPanel(QWidget):
         # 发送成功后清空输入框（可选）
         # self.clear_instruction_text()
     
+    @staticmethod
+    def _make_command(**fields) -> Dict[str, Any]:
+        """
+        构建标准化命令数据：公共字段（timestamp、source）在这里统一填充，
+        调用方只传入命令相关字段（type、instruction、template 等）
+        """
+        command_data = {"timestamp": _now().isoformat(timespec="milliseconds"), "source": "gui"}
+        command_data.update(fields)
+        return command_data
+    
     def _on_publish_template_selected(self, template_name: str):
         """处理发布指令模板选择事件"""
         if template_name:
@@ -195,16 +204,38 @@ class CommandPanel(QWidget):
     def clear_instruction_text(self):
         self.text_edit.clear()
 
+    @staticmethod
+    def _rebuild_combo(combo: ComboBox, items: tuple):
+        """屏蔽信号、暂停重绘后重建下拉框选项，并尽量保持原有选中项"""
+        current = combo.currentText()
+        combo.setUpdatesEnabled(False)
+        try:
+            # QSignalBlocker 在退出作用域（包括异常）时自动恢复信号，
+            # 恢复选中项也不会触发 currentTextChanged
+            with QSignalBlocker(combo):
+                combo.clear()
+                if items:
+                    combo.addItems(list(items))
+                    if current in items:
+                        combo.setCurrentIndex(items.index(current))
+        finally:
+            combo.setUpdatesEnabled(True)
+            combo.update()
+
     def set_publish_templates(self, templates):
         """设置“发布任务指令模板”下拉选项"""
-        self.publish_template_combo.clear()
-        if templates:
-            self.publish_template_combo.addItems(list(templates))
+        new = tuple(templates or ())
+        if new == self._last_publish_templates:
+            return
+        self._rebuild_combo(self.publish_template_combo, new)
+        self._last_publish_templates = new
 
     def set_modify_templates(self, templates):
         """设置“修改指令模板”下拉选项"""
-        self.modify_template_combo.clear()
-        if templates:
-            self.modify_template_combo.addItems(list(templates))
+        new = tuple(templates or ())
+        if new == self._last_modify_templates:
+            return
+        self._rebuild_combo(self.modify_template_combo, new)
+        self._last_modify_templates = new
 
 
@@ -31,14 +31,7 @@ class PlaceholderPanel(QWidget):
         layout.setSpacing(0)
 
         # 占位面板主体使用仿真面板背景色，header 使用 Theme 中专门配置的 header 颜色
-        self.header = PanelHeader(
-            title,
-            bg_color=Theme.PANEL_SIMULATION_HEADER_BG,
-            border_color=Theme.PANEL_SIMULATION_HEADER_BORDER,
-            left_bar_color=Theme.PANEL_SIMULATION_HEADER_BORDER,
-            # 标题文字使用该面板的主题深色，而不是全局主文字色
-            text_color=Theme.PANEL_SIMULATION_HEADER_BORDER,
-        )
+        self.header = PanelHeader.for_simulation(title)
         layout.addWidget(self.header)
 
         content_widget = QWidget()
@@ -56,18 +49,14 @@ class PlaceholderPanel(QWidget):
         layout.addWidget(content_widget)
 
     # --- 仿真接口的空实现，保障 main_window 兼容 ---
+    # 无论是否 supports_simulation，占位面板都没有可显示的内容，
+    # 因此两个接口直接返回，不再在每次调用时判断 _supports_simulation
     def show_vector_scene(self, scene_data) -> bool:
         """
         保持与旧 SimulationPanel 相同的接口，方便主窗口复用刷新逻辑。
         """
-        if not self._supports_simulation:
-            return False
         return False
 
     def show_image(self, image_path):
-        if not self._supports_simulation:
-            return
         # 无内容显示，占位即可
         return
-
-
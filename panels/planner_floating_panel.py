@@ -1,10 +1,33 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QFrame, QLabel
-from PyQt5.QtCore import pyqtSignal, Qt
+from PyQt5.QtWidgets import QWidget, QGridLayout, QFrame, QLabel
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, Qt, QSignalBlocker
+from PyQt5.QtGui import QFont
 
 from qfluentwidgets import ComboBox
 from MultiAgentGUI.themes import Theme
 
 
+def _build_panel_qss() -> str:
+    # 整个浮窗只安装这一份样式表，子控件通过 objectName 选择器区分
+    return f"""
+        QFrame#plannerFloatingPanel {{
+            background-color: {Theme.CARD_BACKGROUND};
+            border: 2px solid {Theme.PRIMARY};
+            border-radius: {Theme.BORDER_RADIUS}px;
+            padding: 12px;
+        }}
+        QLabel {{
+            color: {Theme.TEXT_PRIMARY};
+            font-size: 9pt;
+        }}
+        QLabel#plannerTitle, QLabel#plannerFactionLabel {{
+            background-color: transparent;
+            border: none;
+            color: {Theme.TEXT_PRIMARY};
+            padding: 0px;
+        }}
+    """
+
+
 class PlannerFloatingPanel(QFrame):
     """
     规划器选择浮窗面板
@@ -16,110 +39,94 @@ class PlannerFloatingPanel(QFrame):
     # 规划器选择变化信号
     planner_selected = pyqtSignal(str, str)  # (faction, planner_name)
     
+    # 标题字体（加粗 10pt）在首次使用时创建，所有实例共享；
+    # 不在模块导入时创建，因为那时 QApplication 可能尚未构造
+    _TITLE_FONT = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        # 上一次设置的几何位置，位置未变化时跳过 setGeometry
+        self._last_geom = None
         self._init_ui()
     
+    @classmethod
+    def _title_font(cls) -> QFont:
+        if cls._TITLE_FONT is None:
+            font = QFont()
+            font.setBold(True)
+            font.setPointSize(10)
+            cls._TITLE_FONT = font
+        return cls._TITLE_FONT
+    
     def _init_ui(self):
         """初始化UI"""
         self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Theme.CARD_BACKGROUND};
-                border: 2px solid {Theme.PRIMARY};
-                border-radius: {Theme.BORDER_RADIUS}px;
-                padding: 12px;
-            }}
-            QLabel {{
-                color: {Theme.TEXT_PRIMARY};
-                font-size: 9pt;
-            }}
-        """)
+        self.setObjectName("plannerFloatingPanel")
+        self.setStyleSheet(Theme.cached_stylesheet("planner_panel", _build_panel_qss))
         
-        # 创建布局
-        panel_layout = QVBoxLayout(self)
+        # 单个网格布局：第 0 行标题，第 1/2 行为「阵营标签 + 下拉框」
+        panel_layout = QGridLayout(self)
         panel_layout.setContentsMargins(12, 10, 12, 10)
-        panel_layout.setSpacing(10)
+        panel_layout.setVerticalSpacing(10)
+        panel_layout.setHorizontalSpacing(8)
+        # 第 1 列吸收剩余宽度，下拉框左对齐，效果等同于原来每行末尾的弹性空间
+        panel_layout.setColumnStretch(1, 1)
         
         # 标题（无边框，纯文本）
         title_label = QLabel("选择规划器")
-        title_font = title_label.font()
-        title_font.setBold(True)
-        title_font.setPointSize(10)
-        title_label.setFont(title_font)
-        title_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: transparent;
-                border: none;
-                color: {Theme.TEXT_PRIMARY};
-                padding: 0px;
-            }}
-        """)
-        panel_layout.addWidget(title_label)
+        title_label.setFont(self._title_font())
+        title_label.setObjectName("plannerTitle")
+        panel_layout.addWidget(title_label, 0, 0, 1, 2)
         
-        # 红方规划器
-        red_layout = QHBoxLayout()
-        red_layout.setSpacing(8)
-        red_layout.setContentsMargins(0, 0, 0, 0)
-        red_label = QLabel("红方规划器：")
-        red_label.setFixedWidth(80)  # 固定宽度，确保对齐
-        red_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: transparent;
-                border: none;
-                color: {Theme.TEXT_PRIMARY};
-                font-size: 9pt;
-                padding: 0px;
-            }}
-        """)
-        red_label.setAlignment(Qt.AlignVCenter | Qt.AlignRight)  # 右对齐，让冒号对齐
-        self._red_planner_combo = ComboBox()
-        self._red_planner_combo.setMinimumWidth(120)
-        self._red_planner_combo.setMinimumHeight(32)  # 设置最小高度，让下拉框更高
-        self._red_planner_combo.currentTextChanged.connect(
-            lambda text: self.planner_selected.emit("red", text)
-        )
-        red_layout.addWidget(red_label)
-        red_layout.addWidget(self._red_planner_combo)
-        red_layout.addStretch()  # 右侧弹性空间
-        panel_layout.addLayout(red_layout)
-        
-        # 蓝方规划器
-        blue_layout = QHBoxLayout()
-        blue_layout.setSpacing(8)
-        blue_layout.setContentsMargins(0, 0, 0, 0)
-        blue_label = QLabel("蓝方规划器：")
-        blue_label.setFixedWidth(80)  # 固定宽度，确保对齐
-        blue_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: transparent;
-                border: none;
-                color: {Theme.TEXT_PRIMARY};
-                font-size: 9pt;
-                padding: 0px;
-            }}
-        """)
-        blue_label.setAlignment(Qt.AlignVCenter | Qt.AlignRight)  # 右对齐，让冒号对齐
-        self._blue_planner_combo = ComboBox()
-        self._blue_planner_combo.setMinimumWidth(120)
-        self._blue_planner_combo.setMinimumHeight(32)  # 设置最小高度，让下拉框更高
-        self._blue_planner_combo.currentTextChanged.connect(
-            lambda text: self.planner_selected.emit("blue", text)
-        )
-        blue_layout.addWidget(blue_label)
-        blue_layout.addWidget(self._blue_planner_combo)
-        blue_layout.addStretch()  # 右侧弹性空间
-        panel_layout.addLayout(blue_layout)
+        # 红方 / 蓝方规划器
+        self._red_planner_combo = self._add_faction_row(panel_layout, 1, "红方规划器：")
+        self._blue_planner_combo = self._add_faction_row(panel_layout, 2, "蓝方规划器：")
+    
+    def _add_faction_row(self, grid: QGridLayout, row: int, text: str) -> ComboBox:
+        """在网格的指定行添加阵营标签和规划器下拉框，返回下拉框"""
+        label = QLabel(text)
+        label.setFixedWidth(80)  # 固定宽度，确保对齐
+        label.setObjectName("plannerFactionLabel")
+        label.setAlignment(Qt.AlignVCenter | Qt.AlignRight)  # 右对齐，让冒号对齐
+        combo = ComboBox()
+        combo.setMinimumWidth(120)
+        combo.setMinimumHeight(32)  # 设置最小高度，让下拉框更高
+        combo.currentTextChanged.connect(self._on_planner_changed)
+        grid.addWidget(label, row, 0)
+        grid.addWidget(combo, row, 1, Qt.AlignLeft | Qt.AlignVCenter)
+        return combo
+    
+    @pyqtSlot(str)
+    def _on_planner_changed(self, text: str):
+        """红/蓝两个下拉框共用的槽函数，根据信号发送者确定阵营"""
+        faction = "red" if self.sender() is self._red_planner_combo else "blue"
+        self.planner_selected.emit(faction, text)
     
     def set_planner_options(self, red_planners: list, blue_planners: list):
         """设置规划器选项"""
-        self._red_planner_combo.clear()
-        if red_planners:
-            self._red_planner_combo.addItems(red_planners)
+        self._apply_options(self._red_planner_combo, "red", red_planners)
+        self._apply_options(self._blue_planner_combo, "blue", blue_planners)
+    
+    def _apply_options(self, combo: ComboBox, faction: str, planners: list):
+        """
+        选项与当前一致时不做任何事；否则屏蔽信号重建并尽量保留原选中项。
+        重建过程中不会发出中间状态的 planner_selected，只有最终选中项确实变化时才发出一次
+        """
+        items = list(planners or [])
+        if [combo.itemText(i) for i in range(combo.count())] == items:
+            return
+        
+        previous = combo.currentText()
+        with QSignalBlocker(combo):
+            combo.clear()
+            if items:
+                combo.addItems(items)
+                if previous in items:
+                    combo.setCurrentIndex(items.index(previous))
         
-        self._blue_planner_combo.clear()
-        if blue_planners:
-            self._blue_planner_combo.addItems(blue_planners)
+        current = combo.currentText()
+        if current != previous:
+            self.planner_selected.emit(faction, current)
     
     def update_position(self, parent_width: int, parent_height: int, button_x: int, button_y: int):
         """更新浮窗位置，放在按钮的左边"""
@@ -133,5 +140,9 @@ class PlannerFloatingPanel(QFrame):
         panel_x = button_x - panel_width - spacing
         panel_y = button_y - (panel_height - 44) // 2 + vertical_offset  # 按钮高度是 44
         
-        self.setGeometry(panel_x, panel_y, panel_width, panel_height)
+        geom = (panel_x, panel_y, panel_width, panel_height)
+        if geom == self._last_geom:
+            return
+        self._last_geom = geom
+        self.setGeometry(*geom)
 
@@ -1,11 +1,43 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QMenu
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal
 
 from MultiAgentGUI.components.panel_header import PanelHeader
 from MultiAgentGUI.components import GenericSimulationCanvas
 from MultiAgentGUI.themes import Theme
 
 
+# 鼠标按键 → 交互事件中的按键名称
+_BUTTON_NAMES = {
+    Qt.LeftButton: "left",
+    Qt.RightButton: "right",
+    Qt.MiddleButton: "middle",
+}
+
+
+def _build_toolbar_qss() -> str:
+    return f"""
+        QWidget {{
+            background-color: {Theme.PANEL_SIMULATION_SCENARIO_BG};
+            border-bottom: 1px solid {Theme.BORDER};
+        }}
+        QPushButton {{
+            background-color: {Theme.PRIMARY};
+            color: white;
+            border: none;
+            border-radius: {Theme.BORDER_RADIUS_SMALL}px;
+            padding: 6px 16px;
+            font-size: 9pt;
+        }}
+        QPushButton:hover {{
+            background-color: {Theme.PRIMARY_HOVER};
+        }}
+        QLabel {{
+            color: {Theme.TEXT_PRIMARY};
+            font-size: 9pt;
+        }}
+    """
+
+
 class SimulationDesignPanel(QWidget):
     """
     场景设计面板（可编辑）
@@ -48,13 +80,7 @@ class SimulationDesignPanel(QWidget):
         root_layout.setSpacing(0)
 
         # Header：沿用场景设置区域的头部配色
-        header = PanelHeader(
-            title,
-            bg_color=Theme.PANEL_SIMULATION_HEADER_BG,
-            border_color=Theme.PANEL_SIMULATION_HEADER_BORDER,
-            left_bar_color=Theme.PANEL_SIMULATION_HEADER_BORDER,
-            text_color=Theme.PANEL_SIMULATION_HEADER_BORDER,
-        )
+        header = PanelHeader.for_simulation(title)
         root_layout.addWidget(header)
 
         # 工具栏：在 header 下方添加操作栏
@@ -83,17 +109,15 @@ class SimulationDesignPanel(QWidget):
         在内部 pyqtgraph 画布上安装交互回调，
         拦截鼠标点击并将其转换为通用交互事件，抛给上层。
         """
-        self.canvas.scene().sigMouseClicked.connect(self._on_mouse_clicked)
+        # ViewBox 在画布生命周期内不变，缓存下来，避免每次点击都遍历 pyqtgraph 对象树
+        self._viewbox = self.canvas.getPlotItem().getViewBox()
+        self._map_to_view = self._viewbox.mapSceneToView
+        self.canvas.scene().sigMouseClicked.connect(self._on_mouse_clicked, type=Qt.DirectConnection)
 
     def _on_mouse_clicked(self, ev):
-        vb = self.canvas.getPlotItem().getViewBox()
-        pos_in_view = vb.mapSceneToView(ev.scenePos())
-        button = ev.button()
-        button_name = {
-            1: "left",
-            2: "right",
-            4: "middle",
-        }.get(button, "unknown")
+        # 未映射的按键（如侧键）也照常转发，由后端决定是否处理
+        button_name = _BUTTON_NAMES.get(ev.button(), "unknown")
+        pos_in_view = self._map_to_view(ev.scenePos())
         payload = {
             "source": "design",
             "type": "mouse_double_click" if ev.double() else "mouse_press",
@@ -107,27 +131,7 @@ class SimulationDesignPanel(QWidget):
     def _create_toolbar(self) -> QWidget:
         """创建工具栏，包含导入文件和规划器选择"""
         toolbar = QWidget()
-        toolbar.setStyleSheet(f"""
-            QWidget {{
-                background-color: {Theme.PANEL_SIMULATION_SCENARIO_BG};
-                border-bottom: 1px solid {Theme.BORDER};
-            }}
-            QPushButton {{
-                background-color: {Theme.PRIMARY};
-                color: white;
-                border: none;
-                border-radius: {Theme.BORDER_RADIUS_SMALL}px;
-                padding: 6px 16px;
-                font-size: 9pt;
-            }}
-            QPushButton:hover {{
-                background-color: {Theme.PRIMARY_HOVER};
-            }}
-            QLabel {{
-                color: {Theme.TEXT_PRIMARY};
-                font-size: 9pt;
-            }}
-        """)
+        toolbar.setStyleSheet(Theme.cached_stylesheet("design_toolbar", _build_toolbar_qss))
         
         toolbar_layout = QHBoxLayout(toolbar)
         toolbar_layout.setContentsMargins(
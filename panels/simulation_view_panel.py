@@ -1,11 +1,19 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal
 
 from MultiAgentGUI.components.panel_header import PanelHeader
 from MultiAgentGUI.components import GenericSimulationCanvas
 from MultiAgentGUI.themes import Theme
 
 
+# 鼠标按键 → 交互事件中的按键名称
+_BUTTON_NAMES = {
+    Qt.LeftButton: "left",
+    Qt.RightButton: "right",
+    Qt.MiddleButton: "middle",
+}
+
+
 class SimulationViewPanel(QWidget):
     """
     仿真结果查看面板（只读）
@@ -34,13 +42,7 @@ class SimulationViewPanel(QWidget):
         root_layout.setSpacing(0)
 
         # Header：使用仿真面板专用头部配色
-        header = PanelHeader(
-            title,
-            bg_color=Theme.PANEL_SIMULATION_HEADER_BG,
-            border_color=Theme.PANEL_SIMULATION_HEADER_BORDER,
-            left_bar_color=Theme.PANEL_SIMULATION_HEADER_BORDER,
-            text_color=Theme.PANEL_SIMULATION_HEADER_BORDER,
-        )
+        header = PanelHeader.for_simulation(title)
         root_layout.addWidget(header)
 
         # 内容区域：使用仿真面板背景色 + 通用仿真画布
@@ -63,17 +65,15 @@ class SimulationViewPanel(QWidget):
     def _install_interaction_handlers(self):
         """在仿真视图上安装交互回调（目前只转发鼠标点击）。"""
         # 使用 pyqtgraph 的场景点击信号获取逻辑坐标
-        self.canvas.scene().sigMouseClicked.connect(self._on_mouse_clicked)
+        # ViewBox 在画布生命周期内不变，缓存下来，避免每次点击都遍历 pyqtgraph 对象树
+        self._viewbox = self.canvas.getPlotItem().getViewBox()
+        self._map_to_view = self._viewbox.mapSceneToView
+        self.canvas.scene().sigMouseClicked.connect(self._on_mouse_clicked, type=Qt.DirectConnection)
 
     def _on_mouse_clicked(self, ev):
-        vb = self.canvas.getPlotItem().getViewBox()
-        pos_in_view = vb.mapSceneToView(ev.scenePos())
-        button = ev.button()
-        button_name = {
-            1: "left",
-            2: "right",
-            4: "middle",
-        }.get(button, "unknown")
+        # 未映射的按键（如侧键）也照常转发，由后端决定是否处理
+        button_name = _BUTTON_NAMES.get(ev.button(), "unknown")
+        pos_in_view = self._map_to_view(ev.scenePos())
         payload = {
             "source": "view",
             "type": "mouse_double_click" if ev.double() else "mouse_press",
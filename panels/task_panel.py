@@ -1,6 +1,7 @@
 # panels/task_panel.py
+from PyQt5.QtCore import QSignalBlocker
 from PyQt5.QtWidgets import QWidget, QVBoxLayout
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
 from MultiAgentGUI.components.navi_panel import NavigationPanel
 from MultiAgentGUI.components.generic_tablewidget import GenericTableWidget
 from MultiAgentGUI.components.generic_ganntwidget import GenericGanttChart
@@ -26,14 +27,7 @@ class TaskInfoPanel(QWidget):
         layout.setSpacing(0)
         
         # 添加标题栏：颜色使用 Theme 中为任务面板配置的 header 颜色
-        self.header = PanelHeader(
-            "任务信息",
-            bg_color=Theme.PANEL_TASK_HEADER_BG,
-            border_color=Theme.PANEL_TASK_HEADER_BORDER,
-            left_bar_color=Theme.PANEL_TASK_HEADER_BORDER,
-            # 标题文字使用任务面板的主题深色，而不是全局主文字色
-            text_color=Theme.PANEL_TASK_HEADER_BORDER,
-        )
+        self.header = PanelHeader.for_task("任务信息")
         layout.addWidget(self.header)
         
         # 创建内容区域
@@ -59,6 +53,14 @@ class TaskInfoPanel(QWidget):
         self._nav.add_page(self._ltl, "ltl", "LTL公式")
         self._nav.add_page(self._task_graph, "graph", "任务关系图")
 
+        # 上一次加载的输入签名：整体签名相同直接返回，否则只刷新输入变化的视图
+        self._last_key: Optional[int] = None
+        self._tasks_sig: Optional[int] = None
+        self._gantt_sig: Optional[int] = None
+        self._graph_sig: Optional[int] = None
+        # 与 _tasks_sig 对应的甘特图轨道：只有当前时间变化时直接复用，不再重建条形数据
+        self._gantt_tracks: Optional[list] = None
+
     def load_data(self, data: Dict[str, Any], graph_data: Dict[str, Any] = None):
         """
         从中介服务标准格式数据加载任务数据并显示
@@ -78,17 +80,40 @@ class TaskInfoPanel(QWidget):
                 'style': {...}
             }
         """
-        # 使用适配器转换数据
-        table_data = TaskDataAdapter.convert_table_data(data.get('tasks', []))
-        gantt_data = TaskDataAdapter.convert_gantt_data(data)
-        
-        # 获取LTL公式
-        ltl_text = data.get('ltl_formula', '暂无LTL公式')
-        
-        self._table.set_table_data(table_data)
-        self._gantt.update_plot(gantt_data)
-        self._ltl.setText(ltl_text)
-        
-        # 更新任务图（如果提供了图数据）
-        if graph_data:
-            self._task_graph.update_plot(graph_data)
+        tasks = data.get('tasks', [])
+        # 后端提供版本号时直接用作任务签名，避免对整个任务列表 repr 再求哈希
+        revision = data.get('revision')
+        tasks_sig = hash(('revision', revision)) if revision is not None else hash(repr(tasks))
+        gantt_sig = hash((tasks_sig, data.get('current_time', 0)))
+        graph_sig = hash(repr(graph_data)) if graph_data else None
+        key = hash((gantt_sig, data.get('ltl_formula'), graph_sig))
+        if key == self._last_key:
+            return
+        self._last_key = key
+
+        # 几个视图的更新放在同一个批次里：屏蔽信号并暂停重绘，结束后统一绘制一次
+        self.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self._table), QSignalBlocker(self._gantt):
+                if tasks_sig != self._tasks_sig:
+                    # 使用适配器一次遍历同时生成表格数据和甘特图轨道
+                    table_data, self._gantt_tracks = TaskDataAdapter.convert_tasks(tasks)
+                    self._table.set_table_data(table_data)
+                    self._tasks_sig = tasks_sig
+                
+                if gantt_sig != self._gantt_sig:
+                    # 任务未变时（只有当前时间推进）直接复用上次的轨道
+                    self._gantt.update_plot(
+                        TaskDataAdapter.build_gantt_data(self._gantt_tracks, data.get('current_time', 0))
+                    )
+                    self._gantt_sig = gantt_sig
+            
+            # 获取LTL公式（setText 内容相同时 Qt 自身不会重绘）
+            self._ltl.setText(data.get('ltl_formula', '暂无LTL公式'))
+            
+            # 更新任务图（如果提供了图数据）
+            if graph_data and graph_sig != self._graph_sig:
+                self._task_graph.update_plot(graph_data)
+                self._graph_sig = graph_sig
+        finally:
+            self.setUpdatesEnabled(True)
@@ -1,6 +1,5 @@
 # services/__init__.py
-from MultiAgentGUI.services.mediator_service import MediatorService, DataProvider, CommandHandler
-from MultiAgentGUI.services.canvas_renderer import CanvasRenderer
+import importlib
 
 __all__ = [
     'MediatorService',
@@ -8,3 +7,23 @@ __all__ = [
     'CommandHandler',
     'CanvasRenderer',
 ]
+
+# 导出名 → 所在子模块；首次访问时才导入（PEP 562），
+# 只需要 MediatorService 的调用方不会连带导入绘制器接口
+_LAZY = {
+    'MediatorService': '.mediator_service',
+    'DataProvider': '.mediator_service',
+    'CommandHandler': '.mediator_service',
+    'CanvasRenderer': '.canvas_renderer',
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # 缓存到模块全局，之后的访问不再经过 __getattr__
+    globals()[name] = value
+    return value
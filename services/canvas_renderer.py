@@ -28,7 +28,7 @@
 └─────────────────────────────────────────────────────────┘
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
 from typing import Any as TypingAny
 
 
@@ -74,9 +74,26 @@ class CanvasRenderer(ABC):
         职责：
         - 根据后端数据更新画布显示
         - 可以增量更新，也可以全量重绘
+        - scene_data 中可能带有 'agent_positions'（(n, 2) 的 float32 numpy 数组），
+          存在时应直接交给绘图对象，避免每帧从 agents 字典列表重新构造坐标
         """
         pass
     
+    def render_scene_updates(self, canvas: TypingAny, scene_data_list: Sequence[Dict[str, Any]]) -> None:
+        """
+        批量渲染多帧场景更新（可选方法）
+        
+        参数：
+            canvas: 画布组件
+            scene_data_list: 按时间顺序排列的多帧场景数据（如回放拖动时积压的帧）
+        
+        职责：
+        - 默认实现逐帧调用 render_scene_update，与单帧调用效果一致
+        - 全量重绘的绘制器可以覆盖此方法，只绘制最后一帧，避免中间帧的重复重绘
+        """
+        for scene_data in scene_data_list:
+            self.render_scene_update(canvas, scene_data)
+    
     @abstractmethod
     def render_background(self, canvas: TypingAny, background_path: Optional[str]) -> None:
         """
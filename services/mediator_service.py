@@ -13,12 +13,37 @@ MediatorService同时实现这两个接口，作为统一的中介服务。
 - Controller 获取绘制器并调用，但不知道具体绘制细节
 - 这样既保持了职责分离，又允许后端特定的绘制逻辑
 """
+import logging
+import time
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Any as TypingAny, Optional, Callable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from MultiAgentGUI.services.canvas_renderer import CanvasRenderer
 
+_logger = logging.getLogger(__name__)
+
+# 同一个UI回调连续失败时（例如关闭窗口期间），每隔该秒数最多记录一条日志
+_CALLBACK_ERROR_LOG_INTERVAL = 5.0
+# 每个回调名称上一次记录失败日志的时间，以及此后被抑制的失败次数
+_callback_error_last_logged: Dict[str, float] = {}
+_callback_error_suppressed: Dict[str, int] = {}
+
+
+def _log_callback_error(callback_name: str, message: str, *args) -> None:
+    """按回调名称限频记录UI回调错误，被抑制的次数在下一条日志中一并报告"""
+    now = time.monotonic()
+    last = _callback_error_last_logged.get(callback_name)
+    if last is not None and now - last < _CALLBACK_ERROR_LOG_INTERVAL:
+        _callback_error_suppressed[callback_name] = _callback_error_suppressed.get(callback_name, 0) + 1
+        return
+    _callback_error_last_logged[callback_name] = now
+    suppressed = _callback_error_suppressed.pop(callback_name, 0)
+    if suppressed:
+        message += "（期间另有 %d 次失败未记录）"
+        args += (suppressed,)
+    _logger.warning(message, *args)
+
 
 class DataProvider(ABC):
     """
@@ -89,7 +114,9 @@ class DataProvider(ABC):
                 ...
             ],
             'ltl_formula': str,                  # 所有任务的组合LTL公式
-            'current_time': float                 # 当前时间戳
+            'current_time': float,                # 当前时间戳
+            'revision': int                       # 可选：任务列表版本号，tasks 变化时递增；
+                                                  # 提供时 GUI 直接用它判断任务是否变化，不再对整个列表求签名
         }
         
         注意：作为适配器，此方法应将后端原始数据转换为上述标准格式。
@@ -138,11 +165,14 @@ class DataProvider(ABC):
             ],
             'trajectories': [
                 {
-                    'points': List[List[float]],  # 轨迹点列表 [[x1,y1], [x2,y2], ...]
+                    'points': List[List[float]],  # 轨迹点列表 [[x1,y1], [x2,y2], ...]，
+                                                  # 也可以是形状 (n, 2) 的 float32 数组（绘制时零拷贝使用）
                     'color': str                  # 轨迹颜色
                 },
                 ...
             ],
+            'agent_positions': np.ndarray,        # 可选：形状 (len(agents), 2) 的 float32 坐标数组，
+                                                  # 行顺序与 agents 一致；提供时绘制器直接使用，不再逐个读取 x/y
             'time': float,                        # 当前时间戳
             'limits': {
                 'x_min': float,                   # X轴最小值
@@ -201,7 +231,8 @@ class DataProvider(ABC):
                 ...
             ],
             'layout': {                           # 布局配置（可选）
-                'algorithm': str                  # 布局算法（'spring'/'circular'/'hierarchical'，默认'spring'）
+                'algorithm': str,                 # 布局算法（'spring'/'circular'/'hierarchical'，默认'spring'）
+                'cache_key': str                  # 图结构标识（可选），结构不变时保持不变，UI据此复用已计算的布局
             }
         }
         
@@ -270,6 +301,17 @@ class DataProvider(ABC):
         """
         return False
     
+    def get_scene_version(self) -> Optional[int]:
+        """
+        获取场景版本号
+        返回：场景发生可见变化时递增的整数；返回 None 表示不提供版本
+        
+        注意：
+        - 这是一个可选方法，默认返回 None，前端每次推进后都会重新获取场景并重绘
+        - 版本未变化时，前端跳过 fetch_simulation_scene 和画布重绘
+        """
+        return None
+    
     def get_current_time(self) -> float:
         """
         获取当前仿真时间
@@ -293,6 +335,12 @@ class CommandHandler(ABC):
         """
         接收UI的命令并发送到后端
         
+        注意：Controller 在线程池的工作线程中调用本方法，避免后端耗时阻塞界面。
+        实现中不要直接操作 Qt 界面对象；需要更新界面时使用 _call_ui_callback，
+        show_notification / agent_data_changed / task_data_changed 回调都可以在工作线程中调用。
+        注意：在本方法中调用 notify_*_data_changed() 时，fetch_* 会在工作线程中执行，
+        可能与 GUI 线程的定时拉取并发，实现需保证 fetch_* 对并发读取是安全的。
+        
         参数：
             command_data: 标准化的命令数据字典，可能包含以下格式：
             
@@ -501,6 +549,8 @@ class MediatorService(DataProvider, CommandHandler):
             例如：
             {
                 'show_notification': callable(message, notification_type, duration),
+                'agent_data_changed': callable(agent_data),             # 推送 Agent 数据变化
+                'task_data_changed': callable(task_data, graph_data),   # 推送 Task 数据变化
                 # 未来可以扩展其他操作：
                 # 'show_dialog': callable(title, message, buttons),
                 # 'update_status_bar': callable(message),
@@ -511,6 +561,8 @@ class MediatorService(DataProvider, CommandHandler):
         - Controller 负责在 setup_bindings() 中调用此方法注册回调
         - Mediator 可以在处理命令时调用这些回调来触发UI操作
         - 回调函数的参数格式由Controller定义，Mediator需要按照格式调用
+        - 后端数据变化时，Mediator 应调用 notify_agent_data_changed() /
+          notify_task_data_changed() 主动推送，Controller 的定时拉取只作兜底
         
         使用示例：
         ```python
@@ -525,6 +577,28 @@ class MediatorService(DataProvider, CommandHandler):
         """
         self._ui_callbacks = callbacks
     
+    def notify_agent_data_changed(self) -> None:
+        """
+        通知UI：Agent 数据已变化（推送当前 fetch_agent_data() 的结果）。
+        
+        未注册UI回调时不做任何事。
+        """
+        if self._ui_callbacks is None:
+            return
+        self._call_ui_callback('agent_data_changed', self.fetch_agent_data())
+    
+    def notify_task_data_changed(self) -> None:
+        """
+        通知UI：Task 数据已变化（推送当前 fetch_task_data() / get_task_graph_data() 的结果）。
+        
+        未注册UI回调时不做任何事。
+        """
+        if self._ui_callbacks is None:
+            return
+        self._call_ui_callback(
+            'task_data_changed', self.fetch_task_data(), self.get_task_graph_data()
+        )
+    
     def _call_ui_callback(self, callback_name: str, *args, **kwargs) -> Any:
         """
         调用UI操作回调（内部辅助方法）。
@@ -538,20 +612,22 @@ class MediatorService(DataProvider, CommandHandler):
         注意：
         - 此方法用于Mediator内部调用UI回调
         - 调用前会检查回调是否存在，避免错误
-        - 如果回调调用失败，会打印错误日志但不会抛出异常
-        """
-        if self._ui_callbacks and callback_name in self._ui_callbacks:
-            try:
-                callback = self._ui_callbacks[callback_name]
-                return callback(*args, **kwargs)
-            except Exception as e:
-                print(f"[MediatorService] 调用UI回调 '{callback_name}' 失败: {e}")
-        elif self._ui_callbacks is None:
+        - 如果回调不存在或调用失败，会通过 logging 记录（按回调名称限频）但不会抛出异常
+        """
+        callbacks = self._ui_callbacks
+        if callbacks is None:
             # 回调未注册，这是正常的（可选功能）
-            pass
-        else:
+            return None
+        # 一次字典查找同时完成存在性检查和取值
+        callback = callbacks.get(callback_name)
+        if callback is None:
             # 回调已注册但指定的回调不存在
-            print(f"[MediatorService] UI回调 '{callback_name}' 不存在")
+            _log_callback_error(callback_name, "[MediatorService] UI回调 '%s' 不存在", callback_name)
+            return None
+        try:
+            return callback(*args, **kwargs)
+        except Exception as e:
+            _log_callback_error(callback_name, "[MediatorService] 调用UI回调 '%s' 失败: %s", callback_name, e)
         return None
 
 
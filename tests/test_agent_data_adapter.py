@@ -0,0 +1,38 @@
+# tests/test_agent_data_adapter.py
+"""
+AgentDataAdapter 单元测试
+
+适配器只依赖标准库；这里按文件路径加载模块，避免导入包 __init__ 时连带导入 PyQt5。
+运行：python -m unittest discover -s tests
+"""
+import importlib.util
+import unittest
+from pathlib import Path
+
+_MODULE_PATH = Path(__file__).resolve().parent.parent / "adapters" / "agent_data_adapter.py"
+_spec = importlib.util.spec_from_file_location("agent_data_adapter", _MODULE_PATH)
+agent_data_adapter = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(agent_data_adapter)
+AgentDataAdapter = agent_data_adapter.AgentDataAdapter
+
+
+class PartitionAgentTableDataTest(unittest.TestCase):
+
+    def test_non_str_type_and_status_are_stringified(self):
+        agents = [
+            {'id': 1, 'faction': '红军', 'type': None, 'coalition_id': 0, 'status': 3},
+            {'id': 2, 'faction': '蓝军', 'type': None, 'status': 7},
+        ]
+        friendly, enemy = AgentDataAdapter.partition_agent_table_data(agents)
+        self.assertEqual(friendly, [('1', 'None', '0', '3')])
+        self.assertEqual(enemy, [('2', 'None', '7')])
+
+    def test_str_values_are_mapped(self):
+        agents = [{'id': 1, 'faction': '红军', 'type': 'UAV', 'status': 'idle'}]
+        friendly, enemy = AgentDataAdapter.partition_agent_table_data(agents)
+        self.assertEqual(friendly, [('1', 'UAV', 'N/A', '空闲')])
+        self.assertEqual(enemy, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+# tests/test_mediator_service.py
+"""
+MediatorService UI回调错误日志单元测试
+
+接口模块只依赖标准库；这里按文件路径加载模块，避免导入包 __init__ 时连带导入 PyQt5。
+运行：python -m unittest discover -s tests
+"""
+import importlib.util
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+_MODULE_PATH = Path(__file__).resolve().parent.parent / "services" / "mediator_service.py"
+_spec = importlib.util.spec_from_file_location("mediator_service", _MODULE_PATH)
+mediator_service = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(mediator_service)
+MediatorService = mediator_service.MediatorService
+
+
+def _failing_callback():
+    raise RuntimeError("window closed")
+
+
+class CallUiCallbackTest(unittest.TestCase):
+
+    def setUp(self):
+        mediator_service._callback_error_last_logged.clear()
+        mediator_service._callback_error_suppressed.clear()
+
+    def _call(self, callbacks, name):
+        return MediatorService._call_ui_callback(SimpleNamespace(_ui_callbacks=callbacks), name)
+
+    def test_repeated_failures_are_rate_limited_per_callback(self):
+        callbacks = {'a': _failing_callback, 'b': _failing_callback}
+        with self.assertLogs(mediator_service._logger, level="WARNING") as logs:
+            for _ in range(5):
+                self.assertIsNone(self._call(callbacks, 'a'))
+            self._call(callbacks, 'b')
+        self.assertEqual(len(logs.records), 2)
+        self.assertEqual(mediator_service._callback_error_suppressed, {'a': 4})
+
+    def test_suppressed_count_is_reported_after_interval(self):
+        callbacks = {'a': _failing_callback}
+        with self.assertLogs(mediator_service._logger, level="WARNING") as logs:
+            self._call(callbacks, 'a')
+            self._call(callbacks, 'a')
+            mediator_service._callback_error_last_logged['a'] -= mediator_service._CALLBACK_ERROR_LOG_INTERVAL
+            self._call(callbacks, 'a')
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn("1 次失败未记录", logs.output[-1])
+
+    def test_missing_callback_is_logged(self):
+        with self.assertLogs(mediator_service._logger, level="WARNING") as logs:
+            self.assertIsNone(self._call({}, 'show_notification'))
+        self.assertIn("show_notification", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
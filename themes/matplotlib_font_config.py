@@ -7,6 +7,12 @@ import matplotlib
 import matplotlib.pyplot as plt
 
 
+# 尚未配置过字体的标记（None 是合法结果：表示没有找到中文字体）
+_UNSET = object()
+# 已选定的字体：每个甘特图/任务图组件构造时都会调用 setup_chinese_font，只需配置一次
+_selected_font = _UNSET
+
+
 def setup_chinese_font():
     """
     配置matplotlib使用中文字体（优先使用SimHei黑体）
@@ -20,7 +26,25 @@ def setup_chinese_font():
     6. DejaVu Sans（备用）
 
     如果没有找到中文字体，使用默认字体，但设置unicode支持以尽量减少问题
+    
+    配置结果会被缓存：重复调用直接返回首次选定的字体，
+    也避免重复把同一字体插入 font.sans-serif 列表
     """
+    global _selected_font
+    if _selected_font is not _UNSET:
+        # 其它库可能重置过 rcParams：已选定的字体不在首位时重新放回首位，无需再次扫描字体
+        if _selected_font is not None:
+            current = plt.rcParams['font.sans-serif']
+            if not current or current[0] != _selected_font:
+                plt.rcParams['font.sans-serif'] = [_selected_font] + [f for f in current if f != _selected_font]
+                plt.rcParams['axes.unicode_minus'] = False
+        return _selected_font
+    _selected_font = _configure_chinese_font()
+    return _selected_font
+
+
+def _configure_chinese_font():
+    """实际执行字体检测与配置"""
     try:
         # 尝试使用的中文字体列表（按优先级）
         chinese_fonts = [
@@ -32,8 +56,8 @@ def setup_chinese_font():
             'DejaVu Sans',
         ]
 
-        # 获取系统可用的字体列表
-        available_fonts = [f.name for f in matplotlib.font_manager.fontManager.ttflist]
+        # 获取系统可用的字体名称集合（集合查找为 O(1)）
+        available_fonts = {f.name for f in matplotlib.font_manager.fontManager.ttflist}
 
         # 找到第一个可用的中文字体
         selected_font = None
@@ -4,12 +4,21 @@ GUI主题配色配置文件
 统一管理界面颜色、样式和主题设置
 """
 
+from typing import Callable, Dict, Tuple
+
 from PyQt5.QtGui import QColor
 
 
+# 已生成的样式表缓存：{(样式键, 主题版本): QSS 字符串}
+_QSS_CACHE: Dict[Tuple[str, int], str] = {}
+
+
 class Theme:
     """主题配色方案 - 现代专业风格（浅色主题）"""
     
+    # 主题版本号：修改配色后调用 invalidate_stylesheets() 递增，使缓存的样式表失效
+    VERSION = 0
+    
     # ========== 主色调 ==========
     PRIMARY = "#0078d4"          # 微软蓝 - 专业、可信
     PRIMARY_HOVER = "#106ebe"    # 悬停时加深
@@ -94,9 +103,32 @@ class Theme:
     SIM_BACKGROUND = "#1e1e1e"   # 仿真视图背景 - 深色便于可视化
     SIM_TEXT = "#cccccc"         # 仿真视图文本 - 浅色
     
+    @classmethod
+    def cached_stylesheet(cls, key: str, build: Callable[[], str]) -> str:
+        """
+        按样式键缓存样式表：同一主题版本下每个键只调用一次 build 生成 QSS，
+        之后的面板实例直接复用，避免每次构造都重新拼接 f-string
+        """
+        cache_key = (key, cls.VERSION)
+        qss = _QSS_CACHE.get(cache_key)
+        if qss is None:
+            qss = build()
+            _QSS_CACHE[cache_key] = qss
+        return qss
+    
+    @classmethod
+    def invalidate_stylesheets(cls) -> None:
+        """主题配色变化后调用：递增版本并清空样式表缓存"""
+        cls.VERSION += 1
+        _QSS_CACHE.clear()
+    
     @classmethod
     def get_global_stylesheet(cls) -> str:
-        """获取全局样式表"""
+        """获取全局样式表（同一主题版本下只生成一次）"""
+        return cls.cached_stylesheet("global", cls._build_global_stylesheet)
+    
+    @classmethod
+    def _build_global_stylesheet(cls) -> str:
         return f"""
         /* 全局样式 */
         QWidget {{
@@ -199,7 +231,7 @@ class Theme:
         }}
         
         /* 表格样式 */
-        QTableWidget {{
+        QTableView {{
             background-color: {cls.CARD_BACKGROUND};
             border: 1px solid {cls.BORDER};
             border-radius: {cls.BORDER_RADIUS}px;
@@ -208,13 +240,13 @@ class Theme:
             font-size: 9pt;
         }}
         
-        QTableWidget::item {{
+        QTableView::item {{
             border: none;
             padding: 4px;
             font-size: 9pt;
         }}
         
-        QTableWidget::item:selected {{
+        QTableView::item:selected {{
             background-color: {cls.PRIMARY_LIGHT};
             color: {cls.TEXT_PRIMARY};
         }}
@@ -276,7 +308,11 @@ class Theme:
     
     @classmethod
     def get_card_stylesheet(cls) -> str:
-        """获取卡片专用样式表"""
+        """获取卡片专用样式表（同一主题版本下只生成一次）"""
+        return cls.cached_stylesheet("card", cls._build_card_stylesheet)
+    
+    @classmethod
+    def _build_card_stylesheet(cls) -> str:
         return f"""
         CardWidget {{
             background-color: {cls.CARD_BACKGROUND};
@@ -287,7 +323,11 @@ class Theme:
     
     @classmethod
     def get_simulation_view_stylesheet(cls) -> str:
-        """获取仿真视图专用样式表（深色背景）"""
+        """获取仿真视图专用样式表（深色背景）（同一主题版本下只生成一次）"""
+        return cls.cached_stylesheet("simulation_view", cls._build_simulation_view_stylesheet)
+    
+    @classmethod
+    def _build_simulation_view_stylesheet(cls) -> str:
         return f"""
         QWidget {{
             background-color: {cls.SIM_BACKGROUND};